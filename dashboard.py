@@ -1,8 +1,11 @@
 import streamlit as st
 import pandas as pd
+import pyarrow as pa
 from datetime import datetime
+import os
 import sys
-import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 project_path = Path(__file__).parent
@@ -14,53 +17,125 @@ from forex_scraper.market_news_analyzer import MarketNewsAnalyzer
 
 st.set_page_config(page_title="Forex Dashboard", page_icon="📊", layout="wide")
 
-if 'data_manager' not in st.session_state:
-    st.session_state.data_manager = RealtimeDataManager(data_dir='data')
-if 'event_analyzer' not in st.session_state:
-    st.session_state.event_analyzer = EventOutcomeAnalyzer()
-if 'market_analyzer' not in st.session_state:
-    st.session_state.market_analyzer = MarketNewsAnalyzer()
+# Static widget options / URL slugs — built once at import instead of per rerun
+PAIR_URLS = {'EURUSD': 'eurusd', 'GBPUSD': 'gbpusd', 'USDJPY': 'usdjpy', 'GOLDUSD': 'goldusd', 'AUDUSD': 'audusd'}
+IMPACT_OPTIONS = ["High Impact Expected", "Medium Impact Expected", "Low Impact Expected"]
+CURRENCY_OPTIONS = ["USD", "EUR", "GBP", "JPY", "AUD", "CHF"]
+
+
+# Heavy singletons are shared across reruns (and sessions) instead of being
+# rebuilt per widget interaction.
+@st.cache_resource
+def get_data_manager():
+    return RealtimeDataManager(data_dir='data')
+
+
+@st.cache_resource
+def get_event_analyzer():
+    return EventOutcomeAnalyzer()
+
+
+@st.cache_resource
+def get_market_analyzer():
+    return MarketNewsAnalyzer()
+
+
+def _news_file_mtime(pair):
+    """Mtime of the pair news file; used as a cache key so caches auto-invalidate on rewrite."""
+    try:
+        return os.path.getmtime(f"data/market_news_{pair.lower()}.jsonl")
+    except OSError:
+        return 0.0
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_pair_news(pair, mtime):
+    return get_data_manager().load_pair_specific_news(pair)
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def cached_pair_analysis(pair, mtime):
+    news = cached_pair_news(pair, mtime)
+    if not news:
+        return None
+    return get_market_analyzer().analyze_batch(news[:20])
+
+
+@st.cache_resource
+def get_reactor():
+    """Start the Twisted reactor once on a daemon thread for in-process crawls.
+
+    Spawning `python -m scrapy crawl` per click pays interpreter + settings
+    bootstrap every time; an embedded CrawlerRunner reuses the warm process.
+    """
+    os.environ.setdefault('SCRAPY_SETTINGS_MODULE', 'forex_scraper.settings')
+    from scrapy.utils.reactor import install_reactor
+    install_reactor('twisted.internet.asyncioreactor.AsyncioSelectorReactor')
+    from twisted.internet import reactor
+    thread = threading.Thread(target=reactor.run, kwargs={'installSignalHandlers': False}, daemon=True)
+    thread.start()
+    return reactor
+
+
+def run_market_news_crawl(pair, timeout=120):
+    """Run the market_news spider in-process and block until it finishes."""
+    from scrapy.crawler import CrawlerRunner
+    from scrapy.utils.project import get_project_settings
+
+    reactor = get_reactor()
+    settings = get_project_settings()
+    # Overwrite the pair file like the old `scrapy crawl -O` invocation did
+    settings.set('FEEDS', {
+        f'data/market_news_{pair.lower()}.jsonl': {'format': 'jsonlines', 'overwrite': True},
+    }, priority='cmdline')
+    runner = CrawlerRunner(settings)
+
+    done = threading.Event()
+    outcome = {}
+
+    def _start():
+        deferred = runner.crawl('market_news', pair=pair)
+        deferred.addBoth(lambda result: (outcome.update(result=result), done.set()))
+
+    reactor.callFromThread(_start)
+    if not done.wait(timeout):
+        raise TimeoutError(f"News crawl for {pair} did not finish within {timeout}s")
+
+    result = outcome.get('result')
+    if result is not None and hasattr(result, 'raiseException'):
+        result.raiseException()
+
+
+data_mgr = get_data_manager()
+analyzer = get_event_analyzer()
+market_analyzer = get_market_analyzer()
+
 if 'selected_pair' not in st.session_state:
     st.session_state.selected_pair = 'GOLDUSD'
 
-data_mgr = st.session_state.data_manager
-analyzer = st.session_state.event_analyzer
-market_analyzer = st.session_state.market_analyzer
-
 st.sidebar.title("📊 Forex Dashboard")
 
+# One wall-clock read per rerun; reuse everywhere a "now" is displayed/compared
+now = datetime.now()
+
 available_pairs = data_mgr.get_currency_pairs()
 selected_pair = st.sidebar.selectbox("🔗 Select Pair", options=available_pairs, index=available_pairs.index('GOLDUSD') if 'GOLDUSD' in available_pairs else 0)
 st.session_state.selected_pair = selected_pair
 
-pair_urls = {'EURUSD': 'eurusd', 'GBPUSD': 'gbpusd', 'USDJPY': 'usdjpy', 'GOLDUSD': 'goldusd', 'AUDUSD': 'audusd'}
-pair_url = pair_urls.get(selected_pair, selected_pair.lower())
+pair_url = PAIR_URLS.get(selected_pair, selected_pair.lower())
 forexfactory_url = f"https://www.forexfactory.com/market/{pair_url}"
 st.sidebar.markdown(f"**Market:** [{selected_pair}]({forexfactory_url})")
 
 if st.sidebar.button("📰 Fetch latest news for this pair", use_container_width=True):
     with st.spinner(f"Scraping latest news for {selected_pair}..."):
         try:
-            cmd = [
-                sys.executable,
-                "-m", "scrapy", "crawl", "market_news",
-                "-a", f"pair={selected_pair}",
-                "-O", f"data/market_news_{selected_pair.lower()}.jsonl",  # overwrite instead of append
-            ]
-            result = subprocess.run(
-                cmd,
-                cwd=project_path,
-                capture_output=True,
-                text=True,
-                timeout=120,
-            )
-            if result.returncode == 0:
-                st.success(f"Updated news for {selected_pair}")
-                # Clear cache so new file will be loaded
-                data_mgr.news_cache = None
-            else:
-                st.error("News refresh failed. See logs for details.")
-                st.code(result.stderr[-400:])
+            run_market_news_crawl(selected_pair)
+            st.success(f"Updated news for {selected_pair}")
+            # Clear caches so the rewritten file will be loaded
+            cached_pair_news.clear()
+            cached_pair_analysis.clear()
+            data_mgr.news_cache = None
+            data_mgr.invalidate_pair_news(selected_pair)
         except Exception as e:
             st.error(f"Error while scraping news: {e}")
     st.rerun()
@@ -71,12 +146,12 @@ if st.sidebar.button("🔄 Refresh dashboard", use_container_width=True):
 st.sidebar.markdown("---")
 impact_filter = st.sidebar.multiselect(
     "Impact",
-    ["High Impact Expected", "Medium Impact Expected", "Low Impact Expected"],
+    IMPACT_OPTIONS,
     default=["High Impact Expected"],
 )
 currency_filter = st.sidebar.multiselect(
     "Currencies",
-    ["USD", "EUR", "GBP", "JPY", "AUD", "CHF"],
+    CURRENCY_OPTIONS,
     default=["USD", "EUR", "GBP"],
 )
 watch_pairs = st.sidebar.multiselect(
@@ -92,21 +167,26 @@ col1, col2 = st.columns([3, 1])
 with col1:
     st.markdown(f"# 📈 {selected_pair} Analysis")
 with col2:
-    st.caption(f"Updated: {datetime.now().strftime('%H:%M:%S')}")
+    st.caption(f"Updated: {now.strftime('%H:%M:%S')}")
 
 st.markdown(f"## 📰 News for {selected_pair}")
-pair_news = data_mgr.load_pair_specific_news(selected_pair)
+pair_news = cached_pair_news(selected_pair, _news_file_mtime(selected_pair))
 
 if pair_news:
+    # One DataFrame pass for the stats and the section grouping below
+    df_news = pd.DataFrame(pair_news)
+    head20 = df_news.head(20)
+
     # High-level stats
     col1, col2, col3, col4 = st.columns(4)
-    col1.metric("Total Articles", len(pair_news))
-    col2.metric("Bullish", sum(1 for a in pair_news[:20] if a.get('sentiment') == 'BULLISH'))
-    col3.metric("Bearish", sum(1 for a in pair_news[:20] if a.get('sentiment') == 'BEARISH'))
-    col4.metric("High Impact", sum(1 for a in pair_news[:20] if a.get('impact') == 'HIGH'))
+    col1.metric("Total Articles", len(df_news))
+    sentiment_counts = head20['sentiment'].value_counts() if 'sentiment' in head20.columns else {}
+    col2.metric("Bullish", int(sentiment_counts.get('BULLISH', 0)))
+    col3.metric("Bearish", int(sentiment_counts.get('BEARISH', 0)))
+    col4.metric("High Impact", int((head20['impact'] == 'HIGH').sum()) if 'impact' in head20.columns else 0)
 
     # News-based market outcome analysis
-    analysis = market_analyzer.analyze_batch(pair_news[:20])
+    analysis = cached_pair_analysis(selected_pair, _news_file_mtime(selected_pair))
     if analysis:
         st.markdown("### 🧠 News-based Market Outlook")
         a1, a2, a3, a4 = st.columns(4)
@@ -118,15 +198,15 @@ if pair_news:
     st.markdown("---")
     # Group stories by section so that "Hottest Stories" and
     # "Latest Stories" are displayed like on ForexFactory
-    grouped = {}
-    for article in pair_news:
-        section = article.get('section') or 'Stories'
-        grouped.setdefault(section, []).append(article)
+    if 'section' in df_news.columns:
+        section_labels = df_news['section'].fillna('Stories')
+    else:
+        section_labels = pd.Series('Stories', index=df_news.index)
 
-    for section, articles in grouped.items():
+    for section, sub in df_news.groupby(section_labels, sort=False):
         st.markdown(f"### {section}")
         # Show up to 5 stories per section
-        for article in articles[:5]:
+        for article in sub.head(5).to_dict('records'):
             sentiment = article.get('sentiment', 'NEUTRAL')
             emoji = '🟢' if sentiment == 'BULLISH' else ('🔴' if sentiment == 'BEARISH' else '🟡')
             title = article.get('title', 'N/A')
@@ -148,15 +228,16 @@ else:
     st.warning(f"No news for {selected_pair}. Use the button in the sidebar to fetch latest news.")
 
 st.markdown("## 💡 Signals")
-signals = []
-for pair in watch_pairs:
-    # Use the same news-based analyzer for signals so they align with the outlook above
-    pair_news_for_signal = data_mgr.load_pair_specific_news(pair)
-    if pair_news_for_signal:
-        pair_analysis = market_analyzer.analyze_batch(pair_news_for_signal[:20])
-    else:
-        pair_analysis = None
+# Parallel column lists: the table is built as an Arrow table directly,
+# skipping the pandas DataFrame construction + dtype inference round-trip
+signal_pairs, signal_labels, signal_dirs, signal_confs = [], [], [], []
+# Each pair's load+analysis is independent I/O — run them concurrently so a
+# cold cache costs roughly one pair's latency instead of the sum of all.
+with ThreadPoolExecutor(max_workers=min(8, len(watch_pairs))) as pool:
+    analyses = list(pool.map(lambda p: cached_pair_analysis(p, _news_file_mtime(p)), watch_pairs))
 
+for pair, pair_analysis in zip(watch_pairs, analyses):
+    # Use the same news-based analyzer for signals so they align with the outlook above
     if pair_analysis:
         recommendation = pair_analysis.get('recommendation', 'HOLD')
         direction = pair_analysis.get('probable_direction', 'NEUTRAL')
@@ -173,20 +254,25 @@ for pair in watch_pairs:
     else:
         emoji = '🟡'
 
-    signals.append({
-        'Pair': pair,
-        'Signal': f"{emoji} {recommendation}",
-        'Direction': direction,
-        'Confidence': f"{confidence * 100:.1f}%",
-    })
+    signal_pairs.append(pair)
+    signal_labels.append(f"{emoji} {recommendation}")
+    signal_dirs.append(direction)
+    signal_confs.append(f"{confidence * 100:.1f}%")
 
-df = pd.DataFrame(signals)
-st.dataframe(df, use_container_width=True, hide_index=True)
+signals_table = pa.table({
+    'Pair': signal_pairs,
+    'Signal': signal_labels,
+    'Direction': signal_dirs,
+    'Confidence': signal_confs,
+})
+st.dataframe(signals_table, use_container_width=True, hide_index=True)
 
 st.markdown("## 📅 Events")
 events = data_mgr.load_latest_calendar_events()
 upcoming = data_mgr.get_upcoming_events(hours_ahead=48)
-filtered = [e for e in upcoming if e.get('importance') in impact_filter and e.get('currency') in currency_filter]
+impact_set = frozenset(impact_filter)
+currency_set = frozenset(currency_filter)
+filtered = [e for e in upcoming if e.get('importance') in impact_set and e.get('currency') in currency_set]
 
 if filtered:
     rows = []
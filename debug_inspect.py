@@ -10,30 +10,36 @@ async def inspect():
         context = await browser.new_context()
         page = await context.new_page()
 
-        # Navigate and wait for calendar to load
-        await page.goto('https://www.forexfactory.com/calendar.php', wait_until='networkidle')
-        await page.wait_for_selector('table, tr', timeout=10000)
+        # Navigate and wait only for the calendar rows we actually need;
+        # 'networkidle' can block 10-30s on ad-heavy pages
+        await page.goto('https://www.forexfactory.com/calendar.php', wait_until='domcontentloaded')
+        await page.wait_for_selector('tr', timeout=10000)
 
         # Get first 3 rows to inspect
         html = await page.content()
-        
+
         # Save full HTML for inspection
         with open('d:/PythonProject/web_scraper/debug_calendar.html', 'w', encoding='utf-8') as f:
             f.write(html)
-        
+
         print("✓ Full HTML saved to debug_calendar.html")
 
-        # Get first few table rows and print their HTML
-        rows = await page.locator('tr').all()
-        print(f"Total rows found: {len(rows)}")
+        # Fetch the row HTML in one JS-side map (single round-trip) instead
+        # of awaiting inner_html() per row
+        row_count = await page.locator('tr').count()
+        print(f"Total rows found: {row_count}")
         print("\n--- First 3 rows HTML ---")
-        for i, row in enumerate(rows[:3]):
-            html_content = await row.inner_html()
+        row_htmls = await page.eval_on_selector_all(
+            'tr', 'els => els.slice(0, 3).map(e => e.innerHTML)'
+        )
+        for i, html_content in enumerate(row_htmls):
             print(f"\nRow {i}:\n{html_content[:500]}...\n")
 
         # Try to get cell counts
-        first_row_cells = await rows[0].locator('td').all() if rows else []
-        print(f"Cells in first row: {len(first_row_cells)}")
+        cell_count = await page.eval_on_selector_all(
+            'tr', "els => els.length ? els[0].querySelectorAll('td').length : 0"
+        )
+        print(f"Cells in first row: {cell_count}")
 
         await browser.close()
 
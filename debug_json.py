@@ -1,28 +1,81 @@
 #!/usr/bin/env python
 """Debug JSON extraction from ForexFactory HTML."""
 import re
-import json5
+import orjson
 
-html = open('d:/PythonProject/web_scraper/debug_calendar.html').read()
+_KEY_RE = re.compile(r'([,{\[]\s*)([A-Za-z_]\w*)\s*:')
 
-# Extract just the 'days' array which is the core data
-match = re.search(r'days:\s*\[(.*?)\],\s*time:', html, re.DOTALL)
-if match:
-    days_json = '[' + match.group(1) + ']'
-    print(f"Extracted days array, length: {len(days_json)}")
-    print(f"First 300 chars: {days_json[:300]}")
-    
+
+def scan_matching_bracket(text, start):
+    """Return the index of the ']' closing the '[' at `start`.
+
+    Tracks bracket depth and skips over string literals, so it stays O(n)
+    over the days payload instead of DOTALL-backtracking across the whole
+    HTML document.
+    """
+    depth = 0
+    i = start
+    in_string = False
+    while i < len(text):
+        ch = text[i]
+        if in_string:
+            if ch == '\\':
+                i += 2
+                continue
+            if ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in '[{':
+            depth += 1
+        elif ch in ']}':
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    raise ValueError('Unbalanced brackets in days payload')
+
+
+def extract_days(html):
+    """Extract and parse the embedded `days: [...]` calendar array."""
+    marker = html.find('days:')
+    if marker == -1:
+        return None
+    start = html.find('[', marker)
+    if start == -1:
+        return None
+    end = scan_matching_bracket(html, start)
+    payload = html[start:end + 1]
+    # Quick path: quote the bare JS object keys and let the C parser try.
+    # The quoting regex can mangle key-looking text inside string values,
+    # so on failure reparse the unmodified payload with json5, which
+    # accepts the bare keys natively
     try:
-        days = json5.loads(days_json)
-        print(f"✓ Successfully parsed {len(days)} days with {sum(len(d.get('events', [])) for d in days)} total events")
-        for i, day in enumerate(days):
-            evt_count = len(day.get('events', []))
-            print(f"  Day {i}: {evt_count} events")
-            if evt_count > 0:
-                evt = day['events'][0]
-                print(f"    Example: {evt.get('soloTitle')} ({evt.get('currency')}) - {evt.get('timeLabel')}")
+        return orjson.loads(_KEY_RE.sub(r'\1"\2":', payload))
+    except orjson.JSONDecodeError:
+        import json5
+        return json5.loads(payload)
+
+
+if __name__ == '__main__':
+    html = open('d:/PythonProject/web_scraper/debug_calendar.html').read()
+
+    try:
+        days = extract_days(html)
     except Exception as e:
         print(f"✗ Parse error: {e}")
-else:
-    print("Could not find days array")
-
+        days = None
+    if days is not None:
+        print(f"Extracted days array with {len(days)} entries")
+        try:
+            print(f"✓ Successfully parsed {len(days)} days with {sum(len(d.get('events', [])) for d in days)} total events")
+            for i, day in enumerate(days):
+                evt_count = len(day.get('events', []))
+                print(f"  Day {i}: {evt_count} events")
+                if evt_count > 0:
+                    evt = day['events'][0]
+                    print(f"    Example: {evt.get('soloTitle')} ({evt.get('currency')}) - {evt.get('timeLabel')}")
+        except Exception as e:
+            print(f"✗ Parse error: {e}")
+    else:
+        print("Could not find days array")
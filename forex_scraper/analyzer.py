@@ -1,4 +1,5 @@
 from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+import functools
 import pandas as pd
 import numpy as np
 from typing import List, Dict, Any
@@ -7,27 +8,35 @@ from typing import List, Dict, Any
 class NewsSentiment:
     def __init__(self):
         self.analyzer = SentimentIntensityAnalyzer()
+        # polarity_scores is deterministic, and the same headlines get scored
+        # repeatedly across decide() calls — memoize the compound score
+        self._cached_score = functools.lru_cache(maxsize=4096)(self._raw_score)
+
+    def _raw_score(self, text: str) -> float:
+        return self.analyzer.polarity_scores(text)['compound']
 
     def score(self, text: str) -> float:
         if not text:
             return 0.0
-        s = self.analyzer.polarity_scores(text)
-        return s['compound']
+        return self._cached_score(text)
 
 
 def price_momentum(prices: pd.Series, window: int = 5) -> float:
     """Compute a normalized momentum score between -1 and 1 using percent change over window."""
-    if prices.empty or len(prices) < 2:
+    # .size is a C-level attribute; bail before touching to_numpy at all
+    if prices.size < 2:
         return 0.0
-    returns = prices.pct_change().dropna()
-    if returns.empty:
+    arr = prices.to_numpy(dtype=np.float64, copy=False)
+    # percent changes for the last `window` steps straight off the ndarray,
+    # skipping pandas' pct_change/dropna/tail machinery
+    tail = arr[-(window + 1):]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        returns = np.diff(tail) / tail[:-1]
+    returns = returns[np.isfinite(returns)]
+    if returns.size == 0:
         return 0.0
-    # use mean return over window
-    recent = returns.tail(window)
-    mean = recent.mean()
     # cap to reasonable bounds
-    score = float(np.tanh(mean * 100))
-    return score
+    return float(np.tanh(returns.mean() * 100))
 
 
 class DecisionEngine:
@@ -43,20 +52,33 @@ class DecisionEngine:
         self.momentum_weight = momentum_weight
         self.sentiment = NewsSentiment()
 
-    def decide(self, news_items: List[Dict[str, Any]], prices: pd.Series) -> Dict[str, Any]:
-        # aggregate news sentiment (compound mean)
-        sentiments = []
-        for n in news_items:
-            text = n.get('text') or n.get('summary') or n.get('title') or ''
-            s = n.get('sentiment')
-            if s is None:
-                s = self.sentiment.score(text)
-            sentiments.append(s)
-        news_score = float(pd.Series(sentiments).mean()) if sentiments else 0.0
+    def _score_articles(self, news_items: List[Dict[str, Any]]) -> np.ndarray:
+        """Score every article into one contiguous float64 array.
 
-        mom = price_momentum(prices)
+        Split out of decide() so the dict-touching Python loop runs once and
+        everything downstream operates on a plain ndarray.
+        """
+        return np.fromiter(
+            (
+                n['sentiment'] if n.get('sentiment') is not None
+                else self.sentiment.score(n.get('text') or n.get('summary') or n.get('title') or '')
+                for n in news_items
+            ),
+            dtype=np.float64,
+            count=len(news_items),
+        )
 
-        combined = self.news_weight * news_score + self.momentum_weight * mom
+    @staticmethod
+    def _aggregate(scores: np.ndarray, momentum: float,
+                   news_weight: float, momentum_weight: float) -> tuple:
+        """Fuse article scores and momentum into (combined, news_score)."""
+        news_score = float(scores.mean()) if scores.size else 0.0
+        return news_weight * news_score + momentum_weight * momentum, news_score
+
+    def decide(self, news_items: List[Dict[str, Any]], prices: pd.Series) -> Dict[str, Any]:
+        scores = self._score_articles(news_items)
+        mom = price_momentum(prices)
+        combined, news_score = self._aggregate(scores, mom, self.news_weight, self.momentum_weight)
 
         # map combined score to decision and confidence
         threshold_buy = 0.15
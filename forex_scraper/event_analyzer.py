@@ -8,17 +8,59 @@ For each event type (e.g., "CPI m/m"), we analyze:
 - Typical direction and magnitude of moves
 """
 
-import json
 from datetime import datetime, timedelta
-from collections import defaultdict
-import statistics
+
+import numpy as np
+import orjson
+
+# Column names stored per event; order matches the outcome dicts we expose
+OUTCOME_FIELDS = (
+    'timestamp', 'currency', 'forecast', 'actual',
+    'beat_forecast', 'pair', 'price_move_pct', 'volatility_increase',
+)
+
+
+class _EventStats:
+    """Running reductions for one event name, updated on every append."""
+
+    __slots__ = ('n', 'n_beats', 'n_valid_moves', 'sum_abs_moves', 'n_pos_moves')
+
+    def __init__(self):
+        self.n = 0
+        self.n_beats = 0
+        self.n_valid_moves = 0
+        self.sum_abs_moves = 0.0
+        self.n_pos_moves = 0
+
+    def update(self, beat, move):
+        self.n += 1
+        if beat == 1:
+            self.n_beats += 1
+        if move == move:  # not NaN
+            self.n_valid_moves += 1
+            self.sum_abs_moves += abs(move)
+            if move > 0:
+                self.n_pos_moves += 1
 
 
 class EventOutcomeAnalyzer:
-    """Analyzes historical outcomes of economic events."""
-    
+    """Analyzes historical outcomes of economic events.
+
+    Outcomes are stored column-wise (one list per field, per event name) so
+    the statistical queries can run as numpy reductions instead of Python
+    loops over dicts.
+    """
+
     def __init__(self):
-        self.event_history = defaultdict(list)  # event_name -> [outcomes]
+        self.event_history = {}  # event_name -> {field: [values]}
+        # Running per-event reductions so probability queries are O(1)
+        self._stats = {}
+        # Interned string tables: currencies/pairs are stored as small int
+        # codes so large histories don't hold one string object per outcome
+        self._currency_codes = {}
+        self._currencies = []
+        self._pair_codes = {}
+        self._pairs = []
         self.currency_pairs = {
             'EUR': ['EURUSD', 'EURJPY', 'EURGBP'],
             'GBP': ['GBPUSD', 'GBPJPY', 'EURGBP'],
@@ -44,7 +86,9 @@ class EventOutcomeAnalyzer:
             pair: e.g., "EURUSD"
             price_before: Price before event
             price_after: Price after event (e.g., 30 min later)
-            timestamp: Event time
+            timestamp: Event time. Callers recording in tight loops should
+                pass one datetime for the batch rather than paying a
+                datetime.now() syscall per outcome.
         """
         timestamp = timestamp or datetime.now()
         
@@ -74,8 +118,62 @@ class EventOutcomeAnalyzer:
             'price_move_pct': price_move_pct,
             'volatility_increase': abs(price_move_pct) > 0.3 if price_move_pct else None,
         }
-        
-        self.event_history[event_name].append(outcome)
+
+        self._append_outcome(event_name, outcome)
+
+    @staticmethod
+    def _intern_code(value, codes, values):
+        """Return the small int code for value, growing the table on first sight."""
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(values)
+            values.append(value)
+        return code
+
+    def _append_outcome(self, event_name, outcome):
+        """Append one outcome dict to the columnar store (quantized)."""
+        columns = self.event_history.get(event_name)
+        if columns is None:
+            columns = self.event_history[event_name] = {f: [] for f in OUTCOME_FIELDS}
+        columns['timestamp'].append(outcome.get('timestamp'))
+        columns['currency'].append(self._intern_code(outcome.get('currency'), self._currency_codes, self._currencies))
+        columns['forecast'].append(outcome.get('forecast'))
+        columns['actual'].append(outcome.get('actual'))
+        beat = outcome.get('beat_forecast')
+        columns['beat_forecast'].append(-1 if beat is None else int(beat))
+        columns['pair'].append(self._intern_code(outcome.get('pair'), self._pair_codes, self._pairs))
+        move = outcome.get('price_move_pct')
+        move = np.nan if move is None else float(move)
+        columns['price_move_pct'].append(move)
+        vol = outcome.get('volatility_increase')
+        columns['volatility_increase'].append(-1 if vol is None else int(vol))
+
+        stats = self._stats.get(event_name)
+        if stats is None:
+            stats = self._stats[event_name] = _EventStats()
+        stats.update(columns['beat_forecast'][-1], move)
+
+    def _recent_outcomes(self, event_name, n=3):
+        """Rebuild the last n outcome dicts (decoded) from the columnar store."""
+        columns = self.event_history[event_name]
+        size = len(columns['timestamp'])
+        start = max(0, size - n)
+        outcomes = []
+        for i in range(start, size):
+            move = columns['price_move_pct'][i]
+            beat = columns['beat_forecast'][i]
+            vol = columns['volatility_increase'][i]
+            outcomes.append({
+                'timestamp': columns['timestamp'][i],
+                'currency': self._currencies[columns['currency'][i]],
+                'forecast': columns['forecast'][i],
+                'actual': columns['actual'][i],
+                'beat_forecast': None if beat == -1 else bool(beat),
+                'pair': self._pairs[columns['pair'][i]],
+                'price_move_pct': None if move != move else move,  # NaN -> None
+                'volatility_increase': None if vol == -1 else bool(vol),
+            })
+        return outcomes
     
     def analyze_event_probability(self, event_name, currency, forecast, actual=None):
         """
@@ -106,26 +204,22 @@ class EventOutcomeAnalyzer:
                 'note': 'No historical data available'
             }
         
-        outcomes = self.event_history[event_name]
-        sample_size = len(outcomes)
-        
+        stats = self._stats[event_name]
+        sample_size = stats.n
+
         if sample_size == 0:
             return {'confidence': 0, 'sample_size': 0}
-        
-        # Calculate beat forecast probability
-        beats = sum(1 for o in outcomes if o['beat_forecast'] is True)
-        beat_prob = beats / sample_size if sample_size > 0 else 0.5
-        
-        # Calculate average price move
-        valid_moves = [o['price_move_pct'] for o in outcomes if o['price_move_pct'] is not None]
-        avg_abs_move = statistics.mean(abs(m) for m in valid_moves) if valid_moves else 0.25
-        
+
+        # All reductions come from the running counters: O(1) per query
+        beat_prob = stats.n_beats / sample_size
+        avg_abs_move = stats.sum_abs_moves / stats.n_valid_moves if stats.n_valid_moves else 0.25
+
         # Determine direction (bullish/bearish for the currency)
-        positive_moves = sum(1 for m in valid_moves if m > 0)
-        if len(valid_moves) > 0:
-            if positive_moves / len(valid_moves) > 0.6:
+        if stats.n_valid_moves > 0:
+            positive_ratio = stats.n_pos_moves / stats.n_valid_moves
+            if positive_ratio > 0.6:
                 typical_direction = 'up'
-            elif positive_moves / len(valid_moves) < 0.4:
+            elif positive_ratio < 0.4:
                 typical_direction = 'down'
             else:
                 typical_direction = 'mixed'
@@ -144,7 +238,7 @@ class EventOutcomeAnalyzer:
             'typical_direction': typical_direction,
             'confidence': round(confidence, 2),
             'sample_size': sample_size,
-            'recent_outcomes': outcomes[-3:],  # Last 3 occurrences
+            'recent_outcomes': self._recent_outcomes(event_name),  # Last 3 occurrences
         }
     
     def predict_pair_movement(self, upcoming_event, current_sentiment, 
@@ -175,17 +269,50 @@ class EventOutcomeAnalyzer:
             upcoming_event['currency'],
             upcoming_event.get('forecast')
         )
-        
+        return self._build_pair_prediction(
+            upcoming_event, event_analysis, current_sentiment, current_momentum, pair
+        )
+
+    def predict_pairs_for_event(self, upcoming_event, pairs, sentiments, momenta):
+        """Predict movement for several pairs affected by the same event.
+
+        The event history scan only depends on the event, so it runs exactly
+        once here instead of once per pair as with repeated
+        predict_pair_movement calls.
+
+        Args:
+            upcoming_event: dict with 'name', 'currency', 'forecast', 'importance'
+            pairs: list of pair names
+            sentiments: per-pair sentiment scores, -1 to +1
+            momenta: per-pair momentum scores, -1 to +1
+
+        Returns:
+            List of prediction dicts, one per pair (same shape as
+            predict_pair_movement).
+        """
+        event_analysis = self.analyze_event_probability(
+            upcoming_event['name'],
+            upcoming_event['currency'],
+            upcoming_event.get('forecast')
+        )
+        return [
+            self._build_pair_prediction(upcoming_event, event_analysis, sentiment, momentum, pair)
+            for pair, sentiment, momentum in zip(pairs, sentiments, momenta)
+        ]
+
+    def _build_pair_prediction(self, upcoming_event, event_analysis,
+                               current_sentiment, current_momentum, pair):
+        """Per-pair arithmetic shared by the single- and multi-pair predictors."""
         # Base probability from event history
         event_beat_prob = event_analysis.get('beat_forecast_prob', 0.5)
-        
+
         # Adjust by current sentiment/momentum
         # If sentiment is bullish and event typically beats, boost BUY probability
-        adjusted_up_prob = event_beat_prob * 0.5 + (current_sentiment + 1) / 2 * 0.3 + \
-                          (current_momentum + 1) / 2 * 0.2
+        adjusted_up_prob = event_beat_prob * 0.5 + (current_sentiment + 1) * 0.15 + \
+                          (current_momentum + 1) * 0.1
         adjusted_up_prob = min(1.0, max(0.0, adjusted_up_prob))
         adjusted_down_prob = 1.0 - adjusted_up_prob
-        
+
         # Determine direction
         if adjusted_up_prob > 0.6:
             probable_direction = 'up'
@@ -241,7 +368,7 @@ class EventOutcomeAnalyzer:
     def save_history(self, filepath):
         """Save event history to JSON file for persistence."""
         data = {}
-        for event_name, outcomes in self.event_history.items():
+        for event_name, columns in self.event_history.items():
             data[event_name] = [
                 {
                     'timestamp': o['timestamp'].isoformat() if isinstance(o['timestamp'], datetime) else str(o['timestamp']),
@@ -253,21 +380,21 @@ class EventOutcomeAnalyzer:
                     'price_move_pct': o['price_move_pct'],
                     'volatility_increase': o['volatility_increase'],
                 }
-                for o in outcomes
+                for o in self._recent_outcomes(event_name, n=len(columns['timestamp']))
             ]
-        
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
-    
+
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+
     def load_history(self, filepath):
         """Load event history from JSON file."""
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
+            with open(filepath, 'rb') as f:
+                data = orjson.loads(f.read())
+
             for event_name, outcomes in data.items():
                 for outcome in outcomes:
                     outcome['timestamp'] = datetime.fromisoformat(outcome['timestamp'])
-                    self.event_history[event_name].append(outcome)
+                    self._append_outcome(event_name, outcome)
         except FileNotFoundError:
             pass  # No history file yet
@@ -10,13 +10,21 @@ if an API key is missing.
 from typing import Optional
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import pandas as pd
-import time
 
 
 class MarketDataFetcher:
     def __init__(self, alpha_vantage_key: Optional[str] = None):
         self.av_key = alpha_vantage_key or os.environ.get('ALPHAVANTAGE_API_KEY')
+        # One pooled session for all requests: amortizes the TLS handshake
+        # across polls and retries transient upstream errors with backoff.
+        self._session = requests.Session()
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=10, max_retries=retry)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
 
     def _alpha_vantage_fx_daily(self, from_symbol: str, to_symbol: str, outputsize='compact'):
         url = 'https://www.alphavantage.co/query'
@@ -28,23 +36,25 @@ class MarketDataFetcher:
             'apikey': self.av_key,
             'datatype': 'json'
         }
-        r = requests.get(url, params=params, timeout=30)
+        r = self._session.get(url, params=params, timeout=30)
         r.raise_for_status()
         j = r.json()
         if 'Time Series FX (Daily)' not in j:
             raise RuntimeError('Alpha Vantage response missing expected data: ' + str(j))
         ts = j['Time Series FX (Daily)']
-        records = []
-        for dt, vals in ts.items():
-            records.append({'date': pd.to_datetime(dt), 'close': float(vals['4. close'])})
-        df = pd.DataFrame(records).set_index('date').sort_index()
+        # Build columns straight from the response dict — one allocation and a
+        # vectorized datetime parse instead of a dict per row.
+        df = pd.DataFrame.from_dict(ts, orient='index')
+        df.index = pd.to_datetime(df.index)
+        df.index.name = 'date'
+        df = df[['4. close']].astype(float).rename(columns={'4. close': 'close'}).sort_index()
         return df
 
     def _fallback_exchangerate(self, base: str, quote: str):
         # exchangerate.host provides free rates but only latest; we return only latest as fallback
         url = f'https://api.exchangerate.host/latest'
         params = {'base': base, 'symbols': quote}
-        r = requests.get(url, params=params, timeout=20)
+        r = self._session.get(url, params=params, timeout=20)
         r.raise_for_status()
         j = r.json()
         if 'rates' not in j or quote not in j['rates']:
@@ -75,8 +85,7 @@ class MarketDataFetcher:
             try:
                 return self._alpha_vantage_fx_daily(base, quote, outputsize=outputsize)
             except Exception as e:
-                # brief backoff and fallback
-                time.sleep(1)
+                # Retries/backoff already happened in the session adapter; go straight to fallback
                 try:
                     return self._fallback_exchangerate(base, quote)
                 except Exception:
@@ -1,20 +1,27 @@
-import scrapy
+from dataclasses import dataclass
+from typing import Optional
 
 
-class NewsItem(scrapy.Item):
-    title = scrapy.Field()
-    url = scrapy.Field()
-    date = scrapy.Field()
-    source = scrapy.Field()
-    summary = scrapy.Field()
-    text = scrapy.Field()
-    sentiment = scrapy.Field()
+# Dataclass items (supported by Scrapy via itemadapter) are slotted with
+# direct attribute access — cheaper per item than scrapy.Item's dict plumbing
+# when a crawl emits thousands of them.
 
+@dataclass(slots=True)
+class NewsItem:
+    title: Optional[str] = None
+    url: Optional[str] = None
+    date: Optional[str] = None
+    source: Optional[str] = None
+    summary: Optional[str] = None
+    text: Optional[str] = None
+    sentiment: Optional[str] = None
 
-class EventItem(scrapy.Item):
-    time = scrapy.Field()
-    currency = scrapy.Field()
-    importance = scrapy.Field()
-    event = scrapy.Field()
-    forecast = scrapy.Field()
-    previous = scrapy.Field()
+
+@dataclass(slots=True)
+class EventItem:
+    time: Optional[str] = None
+    currency: Optional[str] = None
+    importance: Optional[str] = None
+    event: Optional[str] = None
+    forecast: Optional[str] = None
+    previous: Optional[str] = None
@@ -9,27 +9,105 @@ Analyzes news articles for currency pairs and predicts probable market effects:
 - Confidence scoring
 """
 
-import json
+import bisect
+import hashlib
+import itertools
+import time
 from pathlib import Path
 from datetime import datetime, timedelta
 from collections import Counter
 import re
 
+import ahocorasick
+import numpy as np
+import orjson
+
+# Economic indicators and their typical effects, in explicit priority order:
+# the first matching phrase wins, so specific multi-word indicators
+# ("crisis lifted", "better than expected") must precede their generic
+# substrings ("crisis", "strong").
+INDICATOR_EFFECTS = {
+    'better than expected': {'direction': 'UP', 'volatility': 'very_high'},
+    'worse than expected': {'direction': 'DOWN', 'volatility': 'very_high'},
+    'crisis lifted': {'direction': 'UP', 'volatility': 'very_high'},
+    'rate hike': {'direction': 'UP', 'volatility': 'very_high'},
+    'rate cut': {'direction': 'DOWN', 'volatility': 'very_high'},
+    'beats': {'direction': 'UP', 'volatility': 'high'},
+    'misses': {'direction': 'DOWN', 'volatility': 'high'},
+    'crisis': {'direction': 'VOLATILE', 'volatility': 'extreme'},
+    'strong': {'direction': 'UP', 'volatility': 'high'},
+    'weak': {'direction': 'DOWN', 'volatility': 'high'},
+}
+
+
+def _build_indicator_automaton():
+    """Compile all indicator keywords into one Aho-Corasick automaton.
+
+    Each phrase carries its position in INDICATOR_EFFECTS as an integer
+    priority (lower wins), so one scan picks the same indicator regardless
+    of where matches occur in the text.
+    """
+    automaton = ahocorasick.Automaton()
+    for priority, (indicator, effect) in enumerate(INDICATOR_EFFECTS.items()):
+        automaton.add_word(indicator, (priority, effect))
+    automaton.make_automaton()
+    return automaton
+
 
 class MarketNewsAnalyzer:
     """Analyze news and predict market outcomes."""
-    
-    def __init__(self, history_file='data/news_analysis_history.json'):
+
+    __slots__ = ('history_file', '_history_fh', 'history', '_history_ts',
+                 '_by_pair', '_memo', '_last_mono', '_last_iso',
+                 'impact_multipliers', 'sentiment_map')
+
+    _indicator_automaton = _build_indicator_automaton()
+
+    # Shared lookup tables; hoisted so predict_price_movement does not
+    # allocate fresh dict literals per article
+    _VOLATILITY_MAP = {
+        'low': 0.5,
+        'medium': 1.0,
+        'high': 1.5,
+        'very_high': 2.0,
+        'extreme': 3.0,
+    }
+    _NEUTRAL_SENTIMENT = {'direction': 'NEUTRAL', 'base_prob': 0.50}
+
+    # Hot-history bound: older entries rotate to the cold archive file so
+    # scans and rewrites stay O(HISTORY_MAXLEN) however long the session runs.
+    # Trimming happens in chunks to amortize the index rebuild.
+    HISTORY_MAXLEN = 10_000
+    _TRIM_SLACK = 1_000
+    # Article-memo bound, sized like the lru_caches on the sentiment paths;
+    # replays of a feed hit recent digests, so FIFO eviction is enough
+    _MEMO_MAXLEN = 4096
+
+    def __init__(self, history_file='data/news_analysis_history.jsonl'):
         self.history_file = Path(history_file)
+        self._history_fh = None  # lazily opened append handle
         self.history = self.load_history()
-        
+        # Parallel index: parsed timestamps (sorted, append order) and
+        # per-pair history indices, so time-window queries bisect instead of
+        # re-parsing every entry's timestamp on each call
+        self._history_ts = []
+        self._by_pair = {}
+        for i, analysis in enumerate(self.history):
+            self._index_entry(i, analysis)
+        self._trim_history()
+        # Article digest -> prior analysis, so feed replays skip re-analysis
+        self._memo = {}
+        # Cached wall-clock stamp, refreshed at most once per second
+        self._last_mono = float('-inf')
+        self._last_iso = ''
+
         # Impact multipliers
         self.impact_multipliers = {
             'HIGH': 1.5,
             'MEDIUM': 1.0,
             'LOW': 0.5,
         }
-        
+
         # Sentiment to direction mapping
         self.sentiment_map = {
             'BULLISH': {'direction': 'UP', 'base_prob': 0.70},
@@ -38,7 +116,20 @@ class MarketNewsAnalyzer:
         }
     
     def analyze_news_article(self, article):
-        """Analyze a single news article."""
+        """Analyze a single news article.
+
+        Re-scraped feeds resubmit the same articles; a compact digest of
+        url + title short-circuits those to the cached prior analysis
+        without re-running the effect/prediction pipeline or re-writing
+        history.
+        """
+        key = hashlib.blake2b(
+            (article.get('url', '') + article.get('title', '')).encode(),
+            digest_size=8).digest()
+        cached = self._memo.get(key)
+        if cached is not None:
+            return cached
+
         try:
             pair = article.get('pair', 'UNKNOWN')
             title = article.get('title', '')
@@ -60,43 +151,54 @@ class MarketNewsAnalyzer:
                 'impact': impact,
                 'market_effect': effect,
                 'prediction': prediction,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': self._now_iso(),
                 'url': article.get('url', ''),
             }
             
             self.history.append(analysis)
-            self.save_history()
-            
+            self._index_entry(len(self.history) - 1, analysis)
+            self._append_history(analysis)
+            self._trim_history()
+            self._memo[key] = analysis
+            if len(self._memo) > self._MEMO_MAXLEN:
+                # Evict the oldest insertion so the memo cannot pin
+                # rotated-out analyses for the life of the process
+                del self._memo[next(iter(self._memo))]
+
             return analysis
         
         except Exception as e:
             print(f"Error analyzing article: {e}")
             return None
     
+    def _now_iso(self):
+        """ISO timestamp, refreshed only when monotonic time moves >1s.
+
+        Batch analysis stamps thousands of entries; reusing the formatted
+        stamp within a one-second window drops the per-article clock read
+        and strftime with at most a second of staleness.
+        """
+        mono = time.monotonic()
+        if mono - self._last_mono >= 1.0:
+            self._last_mono = mono
+            self._last_iso = datetime.now().isoformat()
+        return self._last_iso
+
     def calculate_market_effect(self, title, summary, sentiment, impact):
         """Calculate the expected market effect."""
+        # .lower() takes the ASCII fast path for these headlines; full
+        # Unicode casefolding buys nothing for the ASCII indicator table
         text = (title + ' ' + summary).lower()
-        
-        # Economic indicators and their typical effects
-        indicator_effects = {
-            'strong': {'direction': 'UP', 'volatility': 'high'},
-            'weak': {'direction': 'DOWN', 'volatility': 'high'},
-            'better than expected': {'direction': 'UP', 'volatility': 'very_high'},
-            'worse than expected': {'direction': 'DOWN', 'volatility': 'very_high'},
-            'beats': {'direction': 'UP', 'volatility': 'high'},
-            'misses': {'direction': 'DOWN', 'volatility': 'high'},
-            'rate hike': {'direction': 'UP', 'volatility': 'very_high'},
-            'rate cut': {'direction': 'DOWN', 'volatility': 'very_high'},
-            'crisis': {'direction': 'VOLATILE', 'volatility': 'extreme'},
-            'crisis lifted': {'direction': 'UP', 'volatility': 'very_high'},
-        }
-        
+
+        # One automaton pass over the text instead of a substring scan per
+        # indicator; keep the hit with the best (lowest) table priority
         detected_effect = None
-        for indicator, effect in indicator_effects.items():
-            if indicator in text:
+        best_priority = len(INDICATOR_EFFECTS)
+        for _end, (priority, effect) in self._indicator_automaton.iter(text):
+            if priority < best_priority:
+                best_priority = priority
                 detected_effect = effect
-                break
-        
+
         if not detected_effect:
             detected_effect = {
                 'direction': sentiment,
@@ -109,22 +211,15 @@ class MarketNewsAnalyzer:
         """Predict probable price movement based on news."""
         
         # Base probability from sentiment
-        sentiment_info = self.sentiment_map.get(sentiment, {'direction': 'NEUTRAL', 'base_prob': 0.50})
+        sentiment_info = self.sentiment_map.get(sentiment, self._NEUTRAL_SENTIMENT)
         base_prob = sentiment_info['base_prob']
-        
+
         # Adjust for impact level
         impact_mult = self.impact_multipliers.get(impact, 1.0)
         adjusted_prob = min(0.95, base_prob * impact_mult)
-        
+
         # Calculate volatility
-        volatility_map = {
-            'low': 0.5,
-            'medium': 1.0,
-            'high': 1.5,
-            'very_high': 2.0,
-            'extreme': 3.0,
-        }
-        volatility_multiplier = volatility_map.get(market_effect.get('volatility', 'medium'), 1.0)
+        volatility_multiplier = self._VOLATILITY_MAP.get(market_effect.get('volatility', 'medium'), 1.0)
         expected_volatility = 'high' if volatility_multiplier > 1.5 else ('medium' if volatility_multiplier > 0.8 else 'low')
         
         # Direction
@@ -162,24 +257,32 @@ class MarketNewsAnalyzer:
         if not analyses:
             return None
         
-        # Aggregate statistics
+        # Aggregate statistics: categorical tallies in one pass, float
+        # averages as numpy reductions over preallocated arrays
         pair = articles[0].get('pair', 'UNKNOWN')
-        sentiments = [a['sentiment'] for a in analyses]
-        impacts = [a['impact'] for a in analyses]
-        directions = [a['prediction']['direction'] for a in analyses]
-        
-        # Count votes
-        sentiment_votes = Counter(sentiments)
-        direction_votes = Counter(directions)
-        
+        n = len(analyses)
+        sentiment_votes = Counter()
+        direction_votes = Counter()
+        high_impact = 0
+        medium_impact = 0
+        confidences = np.empty(n, dtype=np.float32)
+        vol_mults = np.empty(n, dtype=np.float32)
+
+        for i, a in enumerate(analyses):
+            sentiment_votes[a['sentiment']] += 1
+            prediction = a['prediction']
+            direction_votes[prediction['direction']] += 1
+            confidences[i] = prediction['confidence']
+            vol_mults[i] = prediction['volatility_multiplier']
+            if a['impact'] == 'HIGH':
+                high_impact += 1
+            elif a['impact'] == 'MEDIUM':
+                medium_impact += 1
+
         # Calculate aggregate prediction
         most_common_sentiment = sentiment_votes.most_common(1)[0][0] if sentiment_votes else 'NEUTRAL'
         most_common_direction = direction_votes.most_common(1)[0][0] if direction_votes else 'NEUTRAL'
-        
-        # Average metrics
-        avg_confidence = sum(a['prediction']['confidence'] for a in analyses) / len(analyses)
-        avg_volatility = sum(a['prediction']['volatility_multiplier'] for a in analyses) / len(analyses)
-        
+
         aggregate = {
             'pair': pair,
             'total_articles': len(analyses),
@@ -187,14 +290,14 @@ class MarketNewsAnalyzer:
             'dominant_sentiment': most_common_sentiment,
             'direction_summary': dict(direction_votes),
             'probable_direction': most_common_direction,
-            'average_confidence': avg_confidence,
-            'average_volatility_multiplier': avg_volatility,
-            'high_impact_articles': len([a for a in analyses if a['impact'] == 'HIGH']),
-            'medium_impact_articles': len([a for a in analyses if a['impact'] == 'MEDIUM']),
+            'average_confidence': float(confidences.mean()),
+            'average_volatility_multiplier': float(vol_mults.mean()),
+            'high_impact_articles': high_impact,
+            'medium_impact_articles': medium_impact,
             'recommendation': self._aggregate_recommendation(analyses),
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': self._now_iso(),
         }
-        
+
         return aggregate
     
     def _aggregate_recommendation(self, analyses):
@@ -208,16 +311,52 @@ class MarketNewsAnalyzer:
         else:
             return 'HOLD'
     
+    def _trim_history(self):
+        """Rotate overflowing history entries to the cold archive file."""
+        if len(self.history) < self.HISTORY_MAXLEN + self._TRIM_SLACK:
+            return
+        evicted = self.history[:-self.HISTORY_MAXLEN]
+        archive_file = self.history_file.with_name(self.history_file.stem + '_archive.jsonl')
+        try:
+            archive_file.parent.mkdir(exist_ok=True)
+            with open(archive_file, 'ab') as f:
+                for analysis in evicted:
+                    f.write(orjson.dumps(analysis, option=orjson.OPT_APPEND_NEWLINE))
+        except Exception as e:
+            print(f"Error archiving history: {e}")
+
+        self.history = self.history[-self.HISTORY_MAXLEN:]
+        # Compact the hot file to the retained tail; otherwise it keeps
+        # every line ever appended and the next startup re-archives the
+        # same evicted entries again
+        try:
+            self.save_history()
+        except Exception as e:
+            print(f"Error compacting history: {e}")
+        # Rebuild the parallel indexes for the shifted positions
+        self._history_ts = []
+        self._by_pair = {}
+        for i, analysis in enumerate(self.history):
+            self._index_entry(i, analysis)
+
+    def _index_entry(self, i, analysis):
+        """Register history entry i in the timestamp and per-pair indexes."""
+        try:
+            ts = datetime.fromisoformat(analysis['timestamp'])
+        except (KeyError, TypeError, ValueError):
+            # Keep the timestamp list monotonic for bisect
+            ts = self._history_ts[-1] if self._history_ts else datetime.min
+        self._history_ts.append(ts)
+        self._by_pair.setdefault(analysis.get('pair'), []).append(i)
+
     def get_pair_analysis(self, pair, hours=24):
         """Get aggregated analysis for a pair in the last N hours."""
-        now = datetime.now()
-        cutoff = now - timedelta(hours=hours)
-        
-        pair_analyses = [
-            a for a in self.history
-            if a.get('pair') == pair and 
-            datetime.fromisoformat(a.get('timestamp', now.isoformat())) > cutoff
-        ]
+        cutoff = datetime.now() - timedelta(hours=hours)
+
+        # O(log N) cutoff lookup + O(k) walk of this pair's indices
+        start = bisect.bisect_right(self._history_ts, cutoff)
+        indices = self._by_pair.get(pair, [])
+        pair_analyses = [self.history[i] for i in indices[bisect.bisect_left(indices, start):]]
         
         if not pair_analyses:
             return None
@@ -245,24 +384,62 @@ class MarketNewsAnalyzer:
         }
     
     def load_history(self):
-        """Load historical analyses."""
+        """Load historical analyses (JSONL; legacy single-JSON files still load)."""
         if self.history_file.exists():
             try:
-                with open(self.history_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
+                raw = self.history_file.read_bytes()
+                if raw.lstrip()[:1] == b'[':
+                    # Legacy format: one big JSON array
+                    return orjson.loads(raw)
+                return [orjson.loads(line) for line in raw.splitlines() if line.strip()]
+            except Exception:
                 return []
+        # First run after the JSONL switch: carry over the pre-existing
+        # .json array file instead of silently starting an empty history
+        legacy_file = self.history_file.with_suffix('.json')
+        if legacy_file.exists():
+            try:
+                history = orjson.loads(legacy_file.read_bytes())
+            except Exception:
+                return []
+            try:
+                with open(self.history_file, 'wb') as f:
+                    for analysis in history:
+                        f.write(orjson.dumps(analysis, option=orjson.OPT_APPEND_NEWLINE))
+            except Exception as e:
+                print(f"Error migrating history to JSONL: {e}")
+            return history
         return []
 
+    def _append_history(self, analysis):
+        """Append one analysis line to the JSONL history file."""
+        try:
+            if self._history_fh is None:
+                self.history_file.parent.mkdir(exist_ok=True)
+                # Unbuffered so each appended line is durable immediately,
+                # like the old rewrite-on-every-article behaviour
+                self._history_fh = open(self.history_file, 'ab', buffering=0)
+            self._history_fh.write(orjson.dumps(analysis, option=orjson.OPT_APPEND_NEWLINE))
+        except Exception as e:
+            print(f"Error appending history: {e}")
+
     def save_history(self):
-        """Save analyses to file."""
+        """Rewrite the full history file (normally appends suffice)."""
         self.history_file.parent.mkdir(exist_ok=True)
-        with open(self.history_file, 'w', encoding='utf-8') as f:
-            json.dump(self.history, f, indent=2, default=str)
+        if self._history_fh is not None:
+            self._history_fh.close()
+            self._history_fh = None
+        with open(self.history_file, 'wb') as f:
+            for analysis in self.history:
+                f.write(orjson.dumps(analysis, option=orjson.OPT_APPEND_NEWLINE))
     
     def get_latest_articles(self, pair=None, limit=10):
-        """Get latest analyzed articles."""
-        articles = self.history
+        """Get latest analyzed articles.
+
+        History is append-ordered by timestamp, so the newest entries are
+        simply the last ones — walk it backwards instead of sorting.
+        """
         if pair:
-            articles = [a for a in articles if a.get('pair') == pair]
-        return sorted(articles, key=lambda x: x.get('timestamp', ''), reverse=True)[:limit]
+            indices = self._by_pair.get(pair, ())
+            return [self.history[i] for i in itertools.islice(reversed(indices), limit)]
+        return list(itertools.islice(reversed(self.history), limit))
@@ -1,10 +1,15 @@
-import json
 from datetime import datetime
 
+import orjson
+from itemadapter import ItemAdapter
+
 
 class JsonWriterPipeline:
     """Simple pipeline that writes items to JSONL files in ./data"""
 
+    # Large write buffer so high-volume spiders amortize syscalls
+    BUFFER_SIZE = 1 << 20
+
     def open_spider(self, spider):
         import os
         self.files = {}
@@ -17,14 +22,13 @@ class JsonWriterPipeline:
     def _get_file(self, spider_name):
         if spider_name not in self.files:
             fname = f"data/{spider_name}_{datetime.utcnow().strftime('%Y%m%dT%H%M%SZ')}.jsonl"
-            f = open(fname, 'w', encoding='utf-8')
+            f = open(fname, 'wb', buffering=self.BUFFER_SIZE)
             self.files[spider_name] = f
         return self.files[spider_name]
 
     def process_item(self, item, spider):
         f = self._get_file(spider.name)
-        line = json.dumps(dict(item), ensure_ascii=False)
-        f.write(line + '\n')
+        f.write(orjson.dumps(ItemAdapter(item).asdict(), option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS))
         return item
 
     def close_spider(self, spider):
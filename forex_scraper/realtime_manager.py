@@ -8,16 +8,35 @@ Loads, caches, and refreshes:
 - Sentiment analysis results
 """
 
-import json
 import os
+import re
+from collections import Counter
 from datetime import datetime, timedelta
 from pathlib import Path
 import glob
 
+import orjson
+
+# Keywords signalling that an article is about a given currency
+CURRENCY_KEYWORDS = {
+    'USD': ['USD', 'US', 'United States', 'dollar', 'federal', 'fed'],
+    'EUR': ['EUR', 'euro', 'European', 'ECB'],
+    'GBP': ['GBP', 'pound', 'BOE', 'Bank of England'],
+    'JPY': ['JPY', 'yen', 'BOJ', 'Bank of Japan'],
+    'AUD': ['AUD', 'Australian'],
+    'XAU': ['gold', 'precious metals'],
+}
+
+# One compiled case-insensitive alternation per currency, built once at import
+_CURRENCY_PATTERNS = {
+    currency: re.compile('|'.join(re.escape(kw) for kw in keywords), re.IGNORECASE)
+    for currency, keywords in CURRENCY_KEYWORDS.items()
+}
+
 
 class RealtimeDataManager:
     """Manages loading and refreshing of market data."""
-    
+
     def __init__(self, data_dir='data'):
         self.data_dir = data_dir
         self.events_cache = None
@@ -25,67 +44,106 @@ class RealtimeDataManager:
         self.sentiment_cache = None
         self.prices_cache = None
         self.last_refresh = {}
-    
-    def load_latest_calendar_events(self):
-        """Load the most recent calendar JSONL file."""
-        calendar_files = glob.glob(os.path.join(self.data_dir, 'economic_calendar_*.jsonl'))
-        if not calendar_files:
-            calendar_files = glob.glob(os.path.join(self.data_dir, 'calendar*.jsonl'))
+        # key -> (path, mtime, parsed) so unchanged files skip the reparse
+        self._file_cache = {}
+        # key -> last returned value, valid until its TTL lapses
+        self._ttl_values = {}
 
-        if not calendar_files:
-            return []
+    def _ttl_cached(self, key, loader, ttl_seconds=30):
+        """Return the cached value for key while it is fresh, else reload.
+
+        Short TTL gate in front of the mtime cache: rapid dashboard polls
+        skip even the glob/stat work, while the mtime check still catches
+        rewritten files once the TTL lapses.
+        """
+        last = self.last_refresh.get(key)
+        if last is not None and key in self._ttl_values and \
+                (datetime.now() - last).total_seconds() < ttl_seconds:
+            return self._ttl_values[key]
+        value = loader()
+        self._ttl_values[key] = value
+        self.last_refresh[key] = datetime.now()
+        return value
 
-        latest_file = max(calendar_files, key=os.path.getctime)
-        events = []
+    def _latest_file(self, *patterns):
+        """Most recently modified file matching any of the glob patterns."""
+        files = []
+        for pattern in patterns:
+            files.extend(glob.glob(os.path.join(self.data_dir, pattern)))
+        if not files:
+            return None
+        return max(files, key=os.path.getmtime)
 
+    def _parse_cached(self, key, filepath, parser):
+        """Parse filepath with parser, reusing the cached result while its mtime is unchanged."""
         try:
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            event = json.loads(line)
-                            events.append(event)
-                        except json.JSONDecodeError:
-                            continue
+            mtime = os.path.getmtime(filepath)
+        except OSError:
+            mtime = None
+        cached = self._file_cache.get(key)
+        if cached is not None and cached[0] == filepath and cached[1] == mtime:
+            return cached[2]
+        parsed = parser(filepath)
+        self._file_cache[key] = (filepath, mtime, parsed)
+        return parsed
+    
+    @staticmethod
+    def _attach_search_text(article):
+        """Precompute the lowercased searchable text once per loaded article."""
+        article['_search'] = (article.get('title', '') + ' ' + article.get('summary', '') +
+                              ' ' + article.get('text', '')).lower()
+
+    def _parse_jsonl(self, filepath):
+        """Parse a JSONL file into a list of dicts, skipping malformed lines."""
+        items = []
+        try:
+            # One bulk read + C-level orjson per line beats buffered text
+            # iteration with stdlib json on large news files
+            for line in Path(filepath).read_bytes().splitlines():
+                if line.strip():
+                    try:
+                        items.append(orjson.loads(line))
+                    except orjson.JSONDecodeError:
+                        continue
         except Exception as e:
-            print(f"Error loading calendar: {e}")
-        
+            print(f"Error loading {filepath}: {e}")
+        return items
+
+    def load_latest_calendar_events(self):
+        """Load the most recent calendar JSONL file."""
+        events = self._ttl_cached('events', self._load_calendar_events)
         self.events_cache = events
-        self.last_refresh['events'] = datetime.now()
         return events
-    
+
+    def _load_calendar_events(self):
+        latest_file = self._latest_file('economic_calendar_*.jsonl') or self._latest_file('calendar*.jsonl')
+        if not latest_file:
+            return []
+        return self._parse_cached('calendar', latest_file, self._parse_jsonl)
+
     def load_latest_news(self, max_articles=50):
         """Load the most recent news JSONL file."""
-        news_files = glob.glob(os.path.join(self.data_dir, '*news*.jsonl')) + \
-                     glob.glob(os.path.join(self.data_dir, '*reuters*.jsonl'))
+        news = self._ttl_cached('news', self._load_news)
+        self.news_cache = news[:max_articles]
+        return news[:max_articles]
 
-        if not news_files:
+    def _load_news(self):
+        latest_file = self._latest_file('*news*.jsonl', '*reuters*.jsonl')
+        if not latest_file:
             return []
 
-        latest_file = max(news_files, key=os.path.getctime)
-        news = []
+        def parse_sorted(filepath):
+            news = self._parse_jsonl(filepath)
+            for article in news:
+                self._attach_search_text(article)
+            # Sort by date descending
+            try:
+                news.sort(key=lambda x: x.get('date', ''), reverse=True)
+            except Exception:
+                pass
+            return news
 
-        try:
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if line.strip():
-                        try:
-                            article = json.loads(line)
-                            news.append(article)
-                        except json.JSONDecodeError:
-                            continue
-        except Exception as e:
-            print(f"Error loading news: {e}")
-        
-        # Sort by date descending
-        try:
-            news.sort(key=lambda x: x.get('date', ''), reverse=True)
-        except:
-            pass
-        
-        self.news_cache = news[:max_articles]
-        self.last_refresh['news'] = datetime.now()
-        return news[:max_articles]
+        return self._parse_cached('news', latest_file, parse_sorted)
     
     def get_upcoming_events(self, hours_ahead=24):
         """Get events in the next N hours."""
@@ -116,41 +174,40 @@ class RealtimeDataManager:
     def get_news_by_currency(self, currency):
         """Get news articles mentioning a specific currency."""
         news = self.news_cache or self.load_latest_news()
-        
-        currency_keywords = {
-            'USD': ['USD', 'US', 'United States', 'dollar', 'federal', 'fed'],
-            'EUR': ['EUR', 'euro', 'European', 'ECB'],
-            'GBP': ['GBP', 'pound', 'BOE', 'Bank of England'],
-            'JPY': ['JPY', 'yen', 'BOJ', 'Bank of Japan'],
-            'AUD': ['AUD', 'Australian'],
-            'XAU': ['gold', 'precious metals'],
-        }
-        
-        keywords = currency_keywords.get(currency, [currency])
+
+        pattern = _CURRENCY_PATTERNS.get(currency)
+        if pattern is None:
+            pattern = re.compile(re.escape(currency), re.IGNORECASE)
         filtered = []
-        
+
         for article in news:
-            text = (article.get('title', '') + ' ' + article.get('summary', '') + ' ' + 
-                   article.get('text', '')).lower()
-            if any(kw.lower() in text for kw in keywords):
+            text = article.get('_search')
+            if text is None:
+                text = (article.get('title', '') + ' ' + article.get('summary', '') + ' ' +
+                       article.get('text', '')).lower()
+            if pattern.search(text):
                 filtered.append(article)
-        
-        return filtered[:10]
+                if len(filtered) >= 10:
+                    break
+
+        return filtered
     
     def get_latest_decisions(self):
         """Load latest trading decisions from run.py output or cache."""
-        decision_files = glob.glob(os.path.join(self.data_dir, '*decision*.json'))
+        return self._ttl_cached('decisions', self._load_decisions)
 
-        if not decision_files:
+    def _load_decisions(self):
+        latest_file = self._latest_file('*decision*.json')
+        if not latest_file:
             return {}
 
-        latest_file = max(decision_files, key=os.path.getctime)
+        def parse_decisions(filepath):
+            try:
+                return orjson.loads(Path(filepath).read_bytes())
+            except Exception:
+                return {}
 
-        try:
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return {}
+        return self._parse_cached('decisions', latest_file, parse_decisions)
     
     def should_refresh(self, key, interval_seconds=300):
         """Check if data should be refreshed based on interval."""
@@ -187,40 +244,55 @@ class RealtimeDataManager:
     
     def load_pair_specific_news(self, pair):
         """Load latest news for a specific pair."""
-        news_files = glob.glob(os.path.join(self.data_dir, f'*market*{pair.lower()}*.jsonl')) + \
-                     glob.glob(os.path.join(self.data_dir, f'*{pair.lower()}_news*.jsonl'))
+        return self._ttl_cached(f'pair_news:{pair.upper()}', lambda: self._load_pair_news(pair))
+
+    def invalidate_pair_news(self, pair):
+        """Forget all cached news for one pair so the next load hits disk.
+
+        Needed after an on-demand crawl: the TTL gate would otherwise keep
+        serving the pre-crawl articles for up to its full window.
+        """
+        key = f'pair_news:{pair.upper()}'
+        self._ttl_values.pop(key, None)
+        self.last_refresh.pop(key, None)
+        self._file_cache.pop(key, None)
 
-        if not news_files:
+    def _load_pair_news(self, pair):
+        pair_lower = pair.lower()
+        latest_file = self._latest_file(f'*market*{pair_lower}*.jsonl', f'*{pair_lower}_news*.jsonl')
+        if not latest_file:
             return []
 
-        latest_file = max(news_files, key=os.path.getctime)
-        news = []
-        seen_keys = set()
+        pair_upper = pair.upper()
 
-        try:
-            with open(latest_file, 'r', encoding='utf-8') as f:
-                for line in f:
+        def parse_pair_news(filepath):
+            news = []
+            seen_keys = set()
+            try:
+                for line in Path(filepath).read_bytes().splitlines():
                     if line.strip():
                         try:
-                            article = json.loads(line)
-                            if article.get('pair', '').upper() == pair.upper():
-                                key = (article.get('url'), article.get('title'))
-                                if key in seen_keys:
-                                    continue
-                                seen_keys.add(key)
-                                news.append(article)
-                        except json.JSONDecodeError:
+                            article = orjson.loads(line)
+                        except orjson.JSONDecodeError:
                             continue
-        except Exception as e:
-            print(f"Error loading pair news for {pair}: {e}")
-        
-        # Sort by timestamp descending
-        try:
-            news.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
-        except:
-            pass
-        
-        return news
+                        if article.get('pair', '').upper() == pair_upper:
+                            key = (article.get('url'), article.get('title'))
+                            if key in seen_keys:
+                                continue
+                            seen_keys.add(key)
+                            self._attach_search_text(article)
+                            news.append(article)
+            except Exception as e:
+                print(f"Error loading pair news for {pair}: {e}")
+
+            # Sort by timestamp descending
+            try:
+                news.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
+            except Exception:
+                pass
+            return news
+
+        return self._parse_cached(f'pair_news:{pair_upper}', latest_file, parse_pair_news)
     
     def get_pair_analysis_summary(self, pair):
         """Get quick analysis summary for a pair."""
@@ -234,22 +306,22 @@ class RealtimeDataManager:
                 'recommendation': 'HOLD',
             }
         
-        # Count sentiments
-        sentiments = {}
-        for article in news[:20]:
-            sent = article.get('sentiment', 'NEUTRAL')
-            sentiments[sent] = sentiments.get(sent, 0) + 1
-        
+        # Count sentiments (first 20) and high-impact articles (all) in one pass
+        sentiments = Counter()
+        high_impact = 0
+        for i, article in enumerate(news):
+            if i < 20:
+                sentiments[article.get('sentiment', 'NEUTRAL')] += 1
+            if article.get('impact') == 'HIGH':
+                high_impact += 1
+
         # Determine dominant sentiment
-        dominant = max(sentiments, key=sentiments.get) if sentiments else 'NEUTRAL'
-        
-        # Count impacts
-        high_impact = sum(1 for a in news if a.get('impact') == 'HIGH')
+        dominant = sentiments.most_common(1)[0][0] if sentiments else 'NEUTRAL'
         
         return {
             'pair': pair,
             'total_articles': len(news),
-            'sentiment_breakdown': sentiments,
+            'sentiment_breakdown': dict(sentiments),
             'dominant_sentiment': dominant,
             'high_impact_count': high_impact,
             'latest_articles': news[:5],
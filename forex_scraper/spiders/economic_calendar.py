@@ -1,6 +1,14 @@
+import re
+
+import orjson
 import scrapy
+
 from ..items import EventItem
 
+# Bare JS object keys ({currency: ...}) quoted in one pass so the payload
+# parses as strict JSON
+_BARE_KEY_RE = re.compile(r'([,{\[]\s*)([A-Za-z_]\w*)\s*:')
+
 
 class EconCalendarSpider(scrapy.Spider):
     """Scrape ForexFactory economic calendar.
@@ -48,26 +56,69 @@ class EconCalendarSpider(scrapy.Spider):
 
             yield scrapy.Request(url, meta={"playwright": True, "playwright_page_methods": pm})
 
+    @staticmethod
+    def _extract_days_json(text):
+        """Slice the `days: [...]` array out of the page with an indexed scan.
+
+        str.find plus a bracket-depth walk stays linear over the array
+        itself, instead of a lazy DOTALL regex backtracking across the whole
+        multi-MB rendered page.
+        """
+        marker = text.find('days:')
+        if marker == -1:
+            return None
+        start = text.find('[', marker)
+        if start == -1:
+            return None
+        depth = 0
+        in_string = False
+        i = start
+        while i < len(text):
+            ch = text[i]
+            if in_string:
+                if ch == '\\':
+                    i += 2
+                    continue
+                if ch == '"':
+                    in_string = False
+            elif ch == '"':
+                in_string = True
+            elif ch in '[{':
+                depth += 1
+            elif ch in ']}':
+                depth -= 1
+                if depth == 0:
+                    return text[start:i + 1]
+            i += 1
+        return None
+
+    @staticmethod
+    def _parse_days(days_json):
+        """Parse the embedded days array: orjson first, json5 as fallback.
+
+        The embedded payload is JSON except for bare object keys; quoting
+        those lets the C parser handle it. json5 (pure Python, orders of
+        magnitude slower) only runs if the quick path fails.
+        """
+        try:
+            return orjson.loads(_BARE_KEY_RE.sub(r'\1"\2":', days_json))
+        except orjson.JSONDecodeError:
+            import json5
+            return json5.loads(days_json)
+
     def parse(self, response):
         """Parse calendar events from embedded JavaScript in the page."""
-        import json5
-        import re
-
         # ForexFactory embeds calendar data as a JavaScript object in window.calendarComponentStates[1].
         # The key data is in the 'days' array which contains event objects for each day.
         # Extract just the days array to simplify parsing.
-        
-        match = re.search(r'days:\s*\[(.*?)\],\s*time:', response.text, re.DOTALL)
-        if not match:
+
+        days_json = self._extract_days_json(response.text)
+        if days_json is None:
             self.logger.warning("Could not find days array in calendar data.")
             return
 
-        # Extract the days array and wrap it in brackets for valid JSON5
-        days_content = match.group(1)
-        days_json = '[' + days_content + ']'
-        
         try:
-            days = json5.loads(days_json)
+            days = self._parse_days(days_json)
         except Exception as e:
             self.logger.error(f"Failed to parse calendar days array: {e}")
             return
@@ -79,14 +130,14 @@ class EconCalendarSpider(scrapy.Spider):
             events = day_obj.get('events', [])
             total_events += len(events)
             for evt in events:
-                item = EventItem()
                 # Map event fields from the JavaScript object to item fields
-                item['time'] = evt.get('timeLabel') or None
-                item['currency'] = evt.get('currency') or None
-                item['importance'] = evt.get('impactTitle') or None
-                item['event'] = evt.get('soloTitle') or evt.get('name') or None
-                item['forecast'] = evt.get('forecast') or None
-                item['previous'] = evt.get('previous') or None
-                yield item
+                yield EventItem(
+                    time=evt.get('timeLabel') or None,
+                    currency=evt.get('currency') or None,
+                    importance=evt.get('impactTitle') or None,
+                    event=evt.get('soloTitle') or evt.get('name') or None,
+                    forecast=evt.get('forecast') or None,
+                    previous=evt.get('previous') or None,
+                )
         
         self.logger.info(f"Extracted {total_events} total events")
@@ -10,10 +10,166 @@ Command:
 """
 
 import scrapy
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+from parsel.csstranslator import HTMLTranslator
 from scrapy_playwright.page import PageMethod
+import functools
+import os
 import re
 from datetime import datetime
 
+# Keyword tables for sentiment / impact classification
+BULLISH_KEYWORDS = (
+    'surge', 'rally', 'gain', 'rise', 'bull', 'strong', 'bullish',
+    'positive', 'upbeat', 'optimism', 'good', 'improvement', 'boost',
+    'support', 'recovery', 'strength', 'break higher', 'above',
+)
+
+BEARISH_KEYWORDS = (
+    'crash', 'fall', 'decline', 'bear', 'weak', 'bearish', 'negative',
+    'pessimism', 'bad', 'concern', 'pressure', 'drop', 'dump', 'sell',
+    'weakness', 'below', 'break lower', 'plunge',
+)
+
+HIGH_IMPACT_KEYWORDS = (
+    'fed', 'ecb', 'boe', 'interest rate', 'fomc', 'gdp', 'inflation',
+    'employment', 'crisis', 'emergency', 'urgent', 'significant', 'major',
+    'breaking', 'shock', 'surprise', 'unexpected',
+)
+
+MEDIUM_IMPACT_KEYWORDS = (
+    'data', 'report', 'release', 'announcement', 'statement', 'commentary',
+    'update', 'change', 'adjustment',
+)
+
+
+def _keyword_bits(keywords):
+    """Assign each keyword one bit so a category's hits fold into an int."""
+    return {kw: 1 << i for i, kw in enumerate(keywords)}
+
+
+def _build_keyword_automaton(*tagged_lists):
+    """Fuse several keyword lists into one Aho-Corasick automaton.
+
+    Each hit carries (tag, bit): one linear pass over the text replaces an
+    O(len(text)) substring scan per keyword, and hits accumulate into a
+    per-category bitmask whose popcount is the distinct-keyword score —
+    duplicate occurrences just re-set the same bit.
+    """
+    automaton = ahocorasick.Automaton()
+    for tag, keywords in tagged_lists:
+        for kw, bit in _keyword_bits(keywords).items():
+            automaton.add_word(kw, (tag, bit))
+    automaton.make_automaton()
+    return automaton
+
+
+# Resources the text extraction never needs: skipping them trims bytes,
+# Chromium render work, and third-party tracker JS from every page load
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+_BLOCKED_URL_FRAGMENTS = ('google-analytics', 'doubleclick', 'hotjar', 'facebook.net')
+
+
+def _should_abort_request(request):
+    return (request.resource_type in _BLOCKED_RESOURCE_TYPES
+            or any(fragment in request.url for fragment in _BLOCKED_URL_FRAGMENTS))
+
+
+if ahocorasick is not None:
+    _SENTIMENT_AC = _build_keyword_automaton(
+        ('BULL', BULLISH_KEYWORDS), ('BEAR', BEARISH_KEYWORDS))
+    _IMPACT_AC = _build_keyword_automaton(
+        ('HIGH', HIGH_IMPACT_KEYWORDS), ('MEDIUM', MEDIUM_IMPACT_KEYWORDS))
+else:
+    _SENTIMENT_AC = _IMPACT_AC = None
+    _BULL_BIT = _keyword_bits(BULLISH_KEYWORDS)
+    _BEAR_BIT = _keyword_bits(BEARISH_KEYWORDS)
+    _HIGH_BIT = _keyword_bits(HIGH_IMPACT_KEYWORDS)
+    _MEDIUM_BIT = _keyword_bits(MEDIUM_IMPACT_KEYWORDS)
+
+
+def _mask_of(bit_table, text):
+    """Fold per-keyword substring checks into the category bitmask.
+
+    Fallback matcher when pyahocorasick is unavailable. Plain `in` checks
+    keep the scoring identical to the automaton path: 'bullish' in a text
+    also sets the 'bull' bit, which a non-overlapping regex alternation
+    would miss.
+    """
+    mask = 0
+    for kw, bit in bit_table.items():
+        if kw in text:
+            mask |= bit
+    return mask
+
+
+# Module-level so lru_cache keys on the text alone; the same story shows up
+# in both the Hottest and Latest blocks and again on every 10-minute
+# refresh, and a cache hit skips the automaton pass entirely
+@functools.lru_cache(maxsize=4096)
+def detect_sentiment(text):
+    """Classify text as BULLISH/BEARISH/NEUTRAL from keyword hits.
+
+    Single automaton traversal; distinct keyword hits are collected per
+    polarity so the scoring matches the old one-point-per-present-keyword
+    substring scan.
+    """
+    text_lower = text.lower()
+
+    bull_mask = 0
+    bear_mask = 0
+    if _SENTIMENT_AC is not None:
+        for _end, (tag, bit) in _SENTIMENT_AC.iter(text_lower):
+            if tag == 'BULL':
+                bull_mask |= bit
+            else:
+                bear_mask |= bit
+    else:
+        bull_mask = _mask_of(_BULL_BIT, text_lower)
+        bear_mask = _mask_of(_BEAR_BIT, text_lower)
+
+    bullish_score = bull_mask.bit_count()
+    bearish_score = bear_mask.bit_count()
+    if bullish_score > bearish_score:
+        return 'BULLISH'
+    elif bearish_score > bullish_score:
+        return 'BEARISH'
+    else:
+        return 'NEUTRAL'
+
+
+@functools.lru_cache(maxsize=4096)
+def detect_impact(text):
+    """Classify text impact as HIGH/MEDIUM/LOW from keyword hits."""
+    text_lower = text.lower()
+
+    high_mask = 0
+    medium_mask = 0
+    if _IMPACT_AC is not None:
+        for _end, (tag, bit) in _IMPACT_AC.iter(text_lower):
+            if tag == 'HIGH':
+                high_mask |= bit
+            else:
+                medium_mask |= bit
+    else:
+        high_mask = _mask_of(_HIGH_BIT, text_lower)
+        medium_mask = _mask_of(_MEDIUM_BIT, text_lower)
+
+    if high_mask.bit_count() >= 2:
+        return 'HIGH'
+    elif medium_mask:
+        return 'MEDIUM'
+    else:
+        return 'LOW'
+
+# Translate every literal CSS selector to XPath once at import; the spider
+# then queries with response.xpath()/story.xpath() and skips the per-call
+# CSS tokenization and translation entirely
+_css2xpath = HTMLTranslator().css_to_xpath
+
 
 class MarketNewsSpider(scrapy.Spider):
     """Scrape news specific to a currency pair from ForexFactory."""
@@ -23,9 +179,64 @@ class MarketNewsSpider(scrapy.Spider):
     custom_settings = {
         # Use Playwright for this spider; global download handler is set in settings.py
         'PLAYWRIGHT_LAUNCH_ARGS': ['--disable-blink-features=AutomationControlled'],
-        'PLAYWRIGHT_ABORT_REQUEST': lambda req: req.resource_type == 'image',
+        'PLAYWRIGHT_ABORT_REQUEST': _should_abort_request,
+        # Broad-crawl tuning: this is a scoped refresh job launched from the
+        # dashboard/scheduler, so favour throughput and fail fast on slow hosts
+        'CONCURRENT_REQUESTS': 64,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 16,
+        'DOWNLOAD_TIMEOUT': 10,
+        'DNS_TIMEOUT': 5,
+        'DNSCACHE_ENABLED': True,
+        'DNSCACHE_SIZE': 10000,
+        'SCHEDULER_PRIORITY_QUEUE': 'scrapy.pqueues.DownloaderAwarePriorityQueue',
+        'REACTOR_THREADPOOL_MAXSIZE': 20,
     }
 
+    # Precompiled XPath forms of the selectors used by parse()
+    _XP_HOTTEST_BLOCKS = _css2xpath('div.flexBox.instrumenthottestnews')
+    _XP_LATEST_BLOCKS = _css2xpath('div.flexBox.instrumentnews')
+    _XP_SECTION_TITLE = _css2xpath('div.head h2::text')
+    _XP_STORY_ITEMS = _css2xpath('ul.body.flexposts > li.flexposts__item')
+    # All container strategies fused into one union so the fallback path
+    # walks the tree once instead of up to four times
+    _XP_FALLBACK_CONTAINERS = ' | '.join((
+        _css2xpath('div.newsItem, div.news-item, div[class*="news"]'),
+        _css2xpath('div.contentBox, div.content-box, div[class*="content"]'),
+        _css2xpath('article, div.post, div[class*="article"]'),
+        _css2xpath('tr[class*="row"], div.row'),
+    ))
+    # Bounded so lxml stops after 100 nodes instead of materializing every
+    # div on the page just to slice the list afterwards
+    _XP_FALLBACK_DIV = '(descendant-or-self::div)[position() <= 100]'
+
+    # ... and by extract_flex_story()
+    _XP_STORY_LINK = _css2xpath('div.flexposts__story-title a')
+    _XP_ALL_TEXT = _css2xpath('::text')
+    _XP_PREVIEW = _css2xpath('p.flexposts__preview span.fader__original::text')
+    _XP_SOURCE_ATTR = _css2xpath('span.flexposts__caption a::attr(data-source)')
+    _XP_SOURCE_TEXT = _css2xpath('span.flexposts__caption a::text')
+    _XP_TIME_TEXT = _css2xpath('span.flexposts__time::text')
+    _XP_TIME_TITLE = _css2xpath('span.flexposts__time::attr(title)')
+    _XP_IMPACT_CLASS = _css2xpath('span.flexposts__storyimpact::attr(class)')
+
+    # ... and by extract_article(). Title candidates as one union: the first
+    # non-blank text among headings, title-ish classes, bold text, or links
+    # in document order, found in a single tree walk
+    _XP_TITLE_UNION = (
+        '(.//h1 | .//h2 | .//h3 | .//h4 | .//h5 | '
+        './/*[contains(@class, "title") or contains(@class, "headline") '
+        'or contains(@class, "heading")] | '
+        './/strong | .//b | .//a)/text()[normalize-space()]'
+    )
+    _XP_DATETIME_ATTR = _css2xpath('time::attr(datetime)')
+    _XP_DATE_CLASSES = _css2xpath('[class*="date"]::text, [class*="time"]::text')
+    _XP_ANCHOR_HREF = _css2xpath('a::attr(href)')
+
+    # Date/time fallback pattern, compiled once instead of per container
+    _DATE_RE = re.compile(
+        r'\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{2}-\d{2}|\d{1,2}:\d{2}|\d+ (?:hour|minute|day)s? ago'
+    )
+
     pair_urls = {
         'EURUSD': 'https://www.forexfactory.com/market/eurusd',
         'GBPUSD': 'https://www.forexfactory.com/market/gbpusd',
@@ -51,28 +262,54 @@ class MarketNewsSpider(scrapy.Spider):
             yield scrapy.Request(
                 url,
                 callback=self.parse,
+                errback=self.retry_with_networkidle,
                 meta={
                     'playwright': True,
                     'playwright_page_methods': [
-                        # Wait for main page load, then give JS a moment to populate content
-                        PageMethod('wait_for_load_state', 'load'),
-                        PageMethod('wait_for_timeout', 5000),  # 5s extra
+                        # Return as soon as the stories widgets have rendered
+                        # instead of sleeping a fixed 5s after load
+                        PageMethod('wait_for_selector',
+                                   'ul.body.flexposts > li.flexposts__item',
+                                   timeout=8000),
                     ],
                 }
             )
 
+    def retry_with_networkidle(self, failure):
+        """Retry once on network-idle if the flexposts selector never showed."""
+        request = failure.request
+        if request.meta.get('networkidle_retry'):
+            self.logger.error(f"Request failed after networkidle retry: {failure.value}")
+            return
+        self.logger.info(f"Selector wait failed ({failure.value}); retrying with networkidle")
+        yield request.replace(
+            meta={
+                'playwright': True,
+                'networkidle_retry': True,
+                'playwright_page_methods': [
+                    PageMethod('wait_for_load_state', 'networkidle', timeout=8000),
+                ],
+            },
+            dont_filter=True,
+        )
+
     def parse(self, response):
         """Parse market page for news articles."""
         self.logger.info(f"Parsing news for {self.pair} from {response.url}")
 
-        # DEBUG: save rendered HTML so we can inspect the exact structure (kept for future tuning)
-        try:
-            debug_path = f"data/market_page_{self.pair.lower()}.html"
-            with open(debug_path, "w", encoding="utf-8") as f:
-                f.write(response.text)
-            self.logger.info(f"Saved debug HTML to {debug_path}")
-        except Exception as e:
-            self.logger.debug(f"Could not save debug HTML: {e}")
+        # DEBUG: optionally save rendered HTML for structure tuning. Off by
+        # default — the unconditional dump was a full-page synchronous write
+        # inside the callback on every scheduled refresh.
+        if self.settings.getbool('MARKET_NEWS_DEBUG_DUMP', False) and response.status == 200:
+            try:
+                debug_path = f"data/market_page_{self.pair.lower()}.html"
+                tmp_path = debug_path + '.tmp'
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    f.write(response.text)
+                os.replace(tmp_path, debug_path)
+                self.logger.info(f"Saved debug HTML to {debug_path}")
+            except Exception as e:
+                self.logger.debug(f"Could not save debug HTML: {e}")
 
         article_count = 0
 
@@ -81,14 +318,14 @@ class MarketNewsSpider(scrapy.Spider):
         # "Hottest Stories" and "Latest Stories" blocks
         # -----------------------------
         flex_blocks = [
-            ("Hottest", response.css('div.flexBox.instrumenthottestnews')),
-            ("Latest", response.css('div.flexBox.instrumentnews')),
+            ("Hottest", response.xpath(self._XP_HOTTEST_BLOCKS)),
+            ("Latest", response.xpath(self._XP_LATEST_BLOCKS)),
         ]
 
         for section_type, blocks in flex_blocks:
             for block in blocks:
-                section_title = block.css('div.head h2::text').get(default="").strip()
-                for story in block.css('ul.body.flexposts > li.flexposts__item'):
+                section_title = block.xpath(self._XP_SECTION_TITLE).get(default="").strip()
+                for story in block.xpath(self._XP_STORY_ITEMS):
                     article = self.extract_flex_story(story, response, section_title)
                     if article:
                         article_count += 1
@@ -110,25 +347,15 @@ class MarketNewsSpider(scrapy.Spider):
         # Try multiple selector strategies
         news_containers = []
 
-        # Strategy 1: Look for news-specific containers
-        news_containers = response.css('div.newsItem, div.news-item, div[class*="news"]')
-
-        # Strategy 2: Look for content boxes
-        if not news_containers:
-            news_containers = response.css('div.contentBox, div.content-box, div[class*="content"]')
-
-        # Strategy 3: Look for article/post containers
-        if not news_containers:
-            news_containers = response.css('article, div.post, div[class*="article"]')
+        # News/content/article/row containers in one union query
+        news_containers = response.xpath(self._XP_FALLBACK_CONTAINERS)
 
-        # Strategy 4: Look for table rows (some pages use tables)
-        if not news_containers:
-            news_containers = response.css('tr[class*="row"], div.row')
-
-        # Strategy 5: Fallback to any div with text content
-        if not news_containers:
+        # Last resort: any div with text content. Off by default — a page
+        # that merely rendered late would otherwise pay a whole-DOM div
+        # sweep for articles the next refresh picks up anyway.
+        if not news_containers and self.settings.getbool('MARKET_NEWS_ENABLE_DIV_FALLBACK', False):
             self.logger.warning(f"Using fallback selector for {response.url}")
-            news_containers = response.css('div')
+            news_containers = response.xpath(self._XP_FALLBACK_DIV)
 
         self.logger.info(f"Found {len(news_containers)} potential news containers (fallback mode)")
 
@@ -144,8 +371,8 @@ class MarketNewsSpider(scrapy.Spider):
     def extract_flex_story(self, story_sel, response, section_title):
         """Extract a single story from a flexposts (instrument news) item."""
         try:
-            link = story_sel.css('div.flexposts__story-title a')
-            title = (link.css('::text').get() or "").strip()
+            link = story_sel.xpath(self._XP_STORY_LINK)
+            title = (link.xpath(self._XP_ALL_TEXT).get() or "").strip()
             if not title:
                 return None
 
@@ -154,32 +381,32 @@ class MarketNewsSpider(scrapy.Spider):
                 url = response.urljoin(url)
 
             # Prefer hidden full preview text where available (Hottest Stories block)
-            summary = story_sel.css('p.flexposts__preview span.fader__original::text').get()
+            summary = story_sel.xpath(self._XP_PREVIEW).get()
             if not summary:
                 # Fallback to the anchor's title attribute (often contains extended text)
                 summary = link.attrib.get('title', '')
             summary = (summary or "").strip()
 
             # Source / provider
-            source = story_sel.css('span.flexposts__caption a::attr(data-source)').get()
+            source = story_sel.xpath(self._XP_SOURCE_ATTR).get()
             if not source:
                 # Text is typically like "From brecorder.com"; strip the leading word
-                source_text = (story_sel.css('span.flexposts__caption a::text').get() or "").strip()
+                source_text = (story_sel.xpath(self._XP_SOURCE_TEXT).get() or "").strip()
                 if source_text.lower().startswith("from "):
                     source = source_text[5:].strip()
                 else:
                     source = source_text or None
 
             # Relative time label (e.g., "5 hr ago") or full timestamp from title attribute
-            time_label = (story_sel.css('span.flexposts__time::text').get() or "").strip()
+            time_label = (story_sel.xpath(self._XP_TIME_TEXT).get() or "").strip()
             if not time_label:
-                time_label = story_sel.css('span.flexposts__time::attr(title)').get()
+                time_label = story_sel.xpath(self._XP_TIME_TITLE).get()
                 if time_label:
                     time_label = time_label.strip()
 
             # Impact from explicit storyimpact badge if present (mainly Latest Stories block)
             impact = None
-            impact_class = story_sel.css('span.flexposts__storyimpact::attr(class)').get() or ""
+            impact_class = story_sel.xpath(self._XP_IMPACT_CLASS).get() or ""
             impact_class = impact_class.lower()
             if 'high' in impact_class:
                 impact = 'HIGH'
@@ -199,12 +426,14 @@ class MarketNewsSpider(scrapy.Spider):
                 'section': section_title or None,
             }
 
-            # Sentiment and impact using existing helpers
-            sentiment = self.detect_sentiment(f"{title}. {summary}")
-            base['sentiment'] = sentiment
+            # Sentiment and impact using existing helpers; one concatenation
+            # shared by both detectors (and their caches). Impact detection
+            # only runs when no explicit badge was parsed above.
+            title_plus_summary = f"{title}. {summary}"
+            base['sentiment'] = self.detect_sentiment(title_plus_summary)
 
             if not impact:
-                impact = self.detect_impact(f"{title}. {summary}")
+                impact = self.detect_impact(title_plus_summary)
             base['impact'] = impact
 
             return base
@@ -215,30 +444,20 @@ class MarketNewsSpider(scrapy.Spider):
     def extract_article(self, container, response):
         """Extract article data from a container."""
         try:
-            # Enhanced title extraction with multiple strategies
-            title = None
+            # Extract the container's text nodes once; the title fallback,
+            # date regex, and summary below all reuse this list instead of
+            # re-walking the subtree
+            all_text = [t.strip() for t in container.xpath(self._XP_ALL_TEXT).getall() if t.strip()]
 
-            # Strategy 1: Common heading tags
-            title = container.css('h1::text, h2::text, h3::text, h4::text, h5::text').get()
+            # First title candidate in document order: headings, title-ish
+            # classes, bold text, or link text — one walk instead of four
+            title = container.xpath(self._XP_TITLE_UNION).get()
 
-            # Strategy 2: Title classes
+            # Fallback: first meaningful chunk of the aggregated text
             if not title:
-                title = container.css('.title::text, .headline::text, .heading::text').get()
-
-            # Strategy 3: Strong/bold text (often used for titles)
-            if not title:
-                title = container.css('strong::text, b::text').get()
-
-            # Strategy 4: First link text (often the title)
-            if not title:
-                title = container.css('a::text').get()
-
-            # Strategy 5: Aggregate all text and take first meaningful chunk
-            if not title:
-                all_text = container.css('::text').getall()
-                all_text = [t.strip() for t in all_text if t.strip() and len(t.strip()) > 15]
-                if all_text:
-                    title = all_text[0][:200]
+                candidates = [t for t in all_text if len(t) > 15]
+                if candidates:
+                    title = candidates[0][:200]
 
             # Skip if no valid title found
             if not title or len(title.strip()) < 10:
@@ -248,36 +467,26 @@ class MarketNewsSpider(scrapy.Spider):
             date_str = None
 
             # Try datetime attribute
-            date_str = container.css('time::attr(datetime)').get()
+            date_str = container.xpath(self._XP_DATETIME_ATTR).get()
 
             # Try date/time classes
             if not date_str:
-                date_str = container.css('[class*="date"]::text, [class*="time"]::text').get()
+                date_str = container.xpath(self._XP_DATE_CLASSES).get()
 
             # Try regex patterns for dates
             if not date_str:
-                date_str = container.css('::text').re_first(
-                    r'\d{1,2}/\d{1,2}/\d{4}|\d{4}-\d{2}-\d{2}|\d{1,2}:\d{2}|\d+ (hour|minute|day)s? ago'
-                )
+                match = self._DATE_RE.search(' '.join(all_text))
+                if match:
+                    date_str = match.group(0)
 
             # Default to current time if no date found
             if not date_str:
                 date_str = datetime.now().strftime('%Y-%m-%d %H:%M')
 
-            # Enhanced summary extraction
-            summary_parts = []
-
-            # Get paragraph text
-            summary_parts.extend(container.css('p::text').getall())
-
-            # Get div text content
-            summary_parts.extend(container.css('div.summary::text, div.content::text, div.description::text').getall())
-
-            # Get span text
-            summary_parts.extend(container.css('span::text').getall())
-
-            # Clean and join
-            summary_parts = [s.strip() for s in summary_parts if s.strip() and len(s.strip()) > 20]
+            # Summary from the cached text nodes (paragraphs, divs and spans
+            # are all in there, in document order) rather than three more
+            # subtree queries
+            summary_parts = [s for s in all_text if len(s) > 20]
             summary = ' '.join(summary_parts[:3])[:600]  # Increased to 600 chars
 
             # If no summary, use title as summary
@@ -285,7 +494,7 @@ class MarketNewsSpider(scrapy.Spider):
                 summary = title
 
             # Enhanced link extraction
-            link = container.css('a::attr(href)').get('')
+            link = container.xpath(self._XP_ANCHOR_HREF).get('')
             if link:
                 if not link.startswith('http'):
                     link = response.urljoin(link)
@@ -320,51 +529,8 @@ class MarketNewsSpider(scrapy.Spider):
 
     def detect_sentiment(self, text):
         """Detect sentiment from text keywords."""
-        text_lower = text.lower()
-
-        bullish_keywords = [
-            'surge', 'rally', 'gain', 'rise', 'bull', 'strong', 'bullish',
-            'positive', 'upbeat', 'optimism', 'good', 'improvement', 'boost',
-            'support', 'recovery', 'strength', 'break higher', 'above',
-        ]
-
-        bearish_keywords = [
-            'crash', 'fall', 'decline', 'bear', 'weak', 'bearish', 'negative',
-            'pessimism', 'bad', 'concern', 'pressure', 'drop', 'dump', 'sell',
-            'weakness', 'below', 'break lower', 'plunge',
-        ]
-
-        bullish_score = sum(1 for kw in bullish_keywords if kw in text_lower)
-        bearish_score = sum(1 for kw in bearish_keywords if kw in text_lower)
-
-        if bullish_score > bearish_score:
-            return 'BULLISH'
-        elif bearish_score > bullish_score:
-            return 'BEARISH'
-        else:
-            return 'NEUTRAL'
+        return detect_sentiment(text)
 
     def detect_impact(self, text):
         """Detect market impact level."""
-        text_lower = text.lower()
-
-        high_impact_keywords = [
-            'fed', 'ecb', 'boe', 'interest rate', 'fomc', 'gdp', 'inflation',
-            'employment', 'crisis', 'emergency', 'urgent', 'significant', 'major',
-            'breaking', 'shock', 'surprise', 'unexpected',
-        ]
-
-        medium_impact_keywords = [
-            'data', 'report', 'release', 'announcement', 'statement', 'commentary',
-            'update', 'change', 'adjustment',
-        ]
-
-        high_impact_count = sum(1 for kw in high_impact_keywords if kw in text_lower)
-        medium_impact_count = sum(1 for kw in medium_impact_keywords if kw in text_lower)
-
-        if high_impact_count >= 2:
-            return 'HIGH'
-        elif medium_impact_count >= 1:
-            return 'MEDIUM'
-        else:
-            return 'LOW'
+        return detect_impact(text)
@@ -1,11 +1,24 @@
 import scrapy
+from parsel.csstranslator import HTMLTranslator
+
 from ..items import NewsItem
 
+_css2xpath = HTMLTranslator().css_to_xpath
+
 
 class ReutersNewsSpider(scrapy.Spider):
     name = 'reuters_news'
     allowed_domains = ['reuters.com']
     start_urls = ['https://www.reuters.com/markets/']
+    custom_settings = {
+        # Article pages all live on one domain; fetch them over a wider pool
+        # of kept-alive connections instead of Scrapy's conservative default
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 16,
+    }
+
+    # Precompiled forms of the per-article selectors
+    _XP_BODY_PARAGRAPHS = _css2xpath('div.ArticleBody__content__17Yit p::text')
+    _XP_ALL_PARAGRAPHS = _css2xpath('p::text')
 
     def parse(self, response):
         # This selector is intentionally simple and may need adjustments for site changes
@@ -17,21 +30,21 @@ class ReutersNewsSpider(scrapy.Spider):
             if url.startswith('/'):
                 url = response.urljoin(url)
 
-            item = NewsItem()
-            item['title'] = title.strip() if title else None
-            item['url'] = url
-            item['source'] = 'reuters'
-            item['date'] = article.css('time::attr(datetime)').get()
-            # brief summary if available
-            item['summary'] = article.css('p::text').get()
+            item = NewsItem(
+                title=title.strip() if title else None,
+                url=url,
+                source='reuters',
+                date=article.css('time::attr(datetime)').get(),
+                # brief summary if available
+                summary=article.css('p::text').get(),
+            )
             yield scrapy.Request(url, callback=self.parse_article, meta={'item': item})
 
     def parse_article(self, response):
         item = response.meta['item']
-        paragraphs = response.css('div.ArticleBody__content__17Yit p::text').getall()
+        paragraphs = response.xpath(self._XP_BODY_PARAGRAPHS).getall()
         if not paragraphs:
             # fallback selectors
-            paragraphs = response.css('p::text').getall()
-        text = '\n'.join([p.strip() for p in paragraphs if p.strip()])
-        item['text'] = text
+            paragraphs = response.xpath(self._XP_ALL_PARAGRAPHS).getall()
+        item.text = '\n'.join(filter(None, (p.strip() for p in paragraphs)))
         yield item
@@ -1,39 +1,51 @@
 """Orchestrator to fetch market data, load recent news JSON, and produce a decision for given pairs."""
 import argparse
-import json
+from concurrent.futures import ThreadPoolExecutor
+import orjson
 from forex_scraper.fetcher import MarketDataFetcher
 from forex_scraper.analyzer import DecisionEngine
 import pandas as pd
 import os
 
 
-def load_recent_news(path='data'):
+def load_recent_news(path='data', max_items=2000):
     # find latest news file in data/
     if not os.path.isdir(path):
         return []
-    files = [os.path.join(path, f) for f in os.listdir(path) if f.startswith('reuters_news') and f.endswith('.jsonl')]
+    # scandir hands back name + stat info in one pass; max() picks the
+    # newest file without building a sorted list
+    with os.scandir(path) as it:
+        files = [entry for entry in it
+                 if entry.name.startswith('reuters_news') and entry.name.endswith('.jsonl')]
     if not files:
         return []
-    files.sort()
-    latest = files[-1]
+    latest = max(files, key=lambda entry: entry.stat().st_mtime).path
     items = []
-    with open(latest, 'r', encoding='utf-8') as fh:
+    # Binary read + orjson per line; the DecisionEngine only needs recent
+    # items, so stop at max_items instead of parsing the whole accumulation
+    with open(latest, 'rb', buffering=1 << 20) as fh:
         for line in fh:
             try:
-                items.append(json.loads(line))
-            except Exception:
+                items.append(orjson.loads(line))
+            except orjson.JSONDecodeError:
                 continue
+            if len(items) >= max_items:
+                break
     return items
 
 
-def main(args):
-    pairs = [p.strip().upper() for p in args.pairs.split(',')]
+def run_once(pairs):
+    """Fetch prices, analyze news, and print a decision for each pair.
+
+    Importable entry point so the scheduler can refresh prices with a
+    direct call instead of spawning a fresh interpreter.
+    """
     fetcher = MarketDataFetcher()
     engine = DecisionEngine()
 
     news_items = load_recent_news()
 
-    for pair in pairs:
+    def process(pair):
         try:
             df = fetcher.get_recent_prices(pair)
             prices = df['close'] if 'close' in df.columns else df.iloc[:, 0]
@@ -41,8 +53,17 @@ def main(args):
             print(f'Could not fetch prices for {pair}: {e}')
             prices = pd.Series([])
 
-        decision = engine.decide(news_items, prices)
-        print(f'Pair {pair}: {decision["decision"]} (conf={decision["confidence"]:.2f}) -- {decision["reason"]}')
+        return engine.decide(news_items, prices)
+
+    # Price fetches are network-bound, so fan the pairs out concurrently;
+    # the shared news_items list is only read by the workers
+    with ThreadPoolExecutor(max_workers=min(8, len(pairs))) as ex:
+        for pair, decision in zip(pairs, ex.map(process, pairs)):
+            print(f'Pair {pair}: {decision["decision"]} (conf={decision["confidence"]:.2f}) -- {decision["reason"]}')
+
+
+def main(args):
+    run_once([p.strip().upper() for p in args.pairs.split(',')])
 
 
 if __name__ == '__main__':
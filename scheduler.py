@@ -7,12 +7,14 @@ Runs scheduled tasks to:
 - Update price data every 5 minutes
 """
 
-import subprocess
+import os
+import threading
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-import json
 import logging
+
+import orjson
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
@@ -33,97 +35,187 @@ Path('logs').mkdir(exist_ok=True)
 class ForexDataScheduler:
     """Manages background data refresh tasks."""
     
+    # Pairs whose market pages are refreshed every cycle
+    pairs_to_monitor = ['GOLDUSD', 'EURUSD', 'GBPUSD', 'USDJPY']
+
     def __init__(self, python_path='C:/Python312/python.exe', project_path=None):
         self.python_path = python_path
         self.project_path = project_path or Path(__file__).parent
         self.scheduler = BackgroundScheduler()
         self.last_updates = {}
+        self._reactor = None
+        # Debounced refresh-log flushing
+        self._log_dirty = False
+        self._log_flush_pending = False
+
+    def _ensure_reactor(self):
+        """Start the Twisted reactor once on a daemon thread for in-process crawls.
+
+        Spawning `scrapy crawl` per refresh pays interpreter + Scrapy +
+        Playwright bootstrap on every cycle; an embedded reactor keeps the
+        process warm across all scheduled crawls.
+        """
+        if self._reactor is None:
+            os.environ.setdefault('SCRAPY_SETTINGS_MODULE', 'forex_scraper.settings')
+            from scrapy.utils.reactor import install_reactor
+            install_reactor('twisted.internet.asyncioreactor.AsyncioSelectorReactor')
+            from twisted.internet import reactor
+            threading.Thread(target=reactor.run,
+                             kwargs={'installSignalHandlers': False},
+                             daemon=True).start()
+            self._reactor = reactor
+        return self._reactor
+
+    def _market_news_settings(self, pair):
+        """Crawl settings for one pair: overwrite feed plus shared-browser caps."""
+        settings = self._feed_settings(f'data/market_news_{pair.lower()}.jsonl', overwrite=True)
+        settings.set('PLAYWRIGHT_MAX_CONTEXTS', 1, priority='cmdline')
+        settings.set('PLAYWRIGHT_MAX_PAGES_PER_CONTEXT', 8, priority='cmdline')
+        return settings
+
+    @staticmethod
+    def _feed_settings(feed_path, overwrite=False):
+        """Project settings with one jsonlines feed, like scrapy crawl -o/-O."""
+        from scrapy.utils.project import get_project_settings
+        settings = get_project_settings()
+        settings.set('FEEDS', {
+            feed_path: {'format': 'jsonlines', 'overwrite': overwrite},
+        }, priority='cmdline')
+        return settings
+
+    def _crawl_in_process(self, spider_name, settings, timeout=120, **spider_kwargs):
+        """Run one spider through the shared reactor and block until done.
+
+        Every crawl reuses the warm interpreter/Twisted/Playwright stack
+        instead of paying a full `python -m scrapy crawl` cold start.
+        """
+        from scrapy.crawler import CrawlerRunner
+
+        reactor = self._ensure_reactor()
+        done = threading.Event()
+        outcome = {}
+
+        def _start():
+            deferred = CrawlerRunner(settings).crawl(spider_name, **spider_kwargs)
+            deferred.addBoth(lambda result: (outcome.update(result=result), done.set()))
+
+        reactor.callFromThread(_start)
+        if not done.wait(timeout):
+            raise TimeoutError(f"Crawl {spider_name} did not finish within {timeout}s")
+        result = outcome.get('result')
+        if result is not None and hasattr(result, 'raiseException'):
+            result.raiseException()
     
     def refresh_calendar(self):
         """Refresh economic calendar data."""
         try:
             logger.info("Starting calendar refresh...")
-            cmd = [
-                self.python_path, 
-                '-m', 'scrapy', 'crawl', 'economic_calendar',
-                '-a', 'timezone=Asia/Manila',
-                '-o', 'data/calendar_latest.jsonl'
-            ]
-            result = subprocess.run(cmd, cwd=self.project_path, capture_output=True, text=True, timeout=120)
-            
-            if result.returncode == 0:
-                logger.info("✓ Calendar refresh completed")
-                self.last_updates['calendar'] = datetime.now().isoformat()
-                self._save_update_log()
-            else:
-                logger.error(f"Calendar refresh failed: {result.stderr}")
+            self._crawl_in_process(
+                'economic_calendar',
+                self._feed_settings('data/calendar_latest.jsonl'),
+                timezone='Asia/Manila')
+            logger.info("✓ Calendar refresh completed")
+            self.last_updates['calendar'] = datetime.now().isoformat()
+            self._save_update_log()
         except Exception as e:
             logger.error(f"Error refreshing calendar: {e}")
-    
+
     def refresh_news(self):
         """Refresh news data."""
         try:
             logger.info("Starting news refresh...")
-            cmd = [
-                self.python_path,
-                '-m', 'scrapy', 'crawl', 'news',
-                '-o', 'data/news_latest.jsonl'
-            ]
-            result = subprocess.run(cmd, cwd=self.project_path, capture_output=True, text=True, timeout=120)
-            
-            if result.returncode == 0:
-                logger.info("✓ News refresh completed")
-                self.last_updates['news'] = datetime.now().isoformat()
-                self._save_update_log()
-            else:
-                logger.error(f"News refresh failed: {result.stderr}")
+            self._crawl_in_process(
+                'reuters_news',
+                self._feed_settings('data/news_latest.jsonl'))
+            logger.info("✓ News refresh completed")
+            self.last_updates['news'] = datetime.now().isoformat()
+            self._save_update_log()
         except Exception as e:
             logger.error(f"Error refreshing news: {e}")
     
-    def refresh_market_news(self, pair='GOLDUSD'):
-        """Refresh pair-specific market news."""
+    def refresh_market_news(self, pairs=None, timeout=300):
+        """Refresh pair-specific market news for all monitored pairs in-process.
+
+        All pairs are dispatched into the shared reactor together, so the
+        crawls overlap instead of paying a serial process launch per pair.
+        """
+        pairs = pairs or self.pairs_to_monitor
         try:
-            logger.info(f"Starting market news refresh for {pair}...")
-            cmd = [
-                self.python_path,
-                '-m', 'scrapy', 'crawl', 'market_news',
-                '-a', f'pair={pair}',
-                '-O', f'data/market_news_{pair.lower()}.jsonl'  # overwrite instead of append
-            ]
-            result = subprocess.run(cmd, cwd=self.project_path, capture_output=True, text=True, timeout=120)
-            
-            if result.returncode == 0:
-                logger.info(f"✓ Market news refresh for {pair} completed")
-                self.last_updates[f'market_news_{pair}'] = datetime.now().isoformat()
-                self._save_update_log()
-            else:
-                logger.error(f"Market news refresh for {pair} failed: {result.stderr}")
+            from scrapy.crawler import CrawlerRunner
+            from twisted.internet.defer import DeferredList
+
+            logger.info(f"Starting market news refresh for {', '.join(pairs)}...")
+            reactor = self._ensure_reactor()
+            done = threading.Event()
+            outcome = {}
+
+            def _start():
+                deferreds = []
+                for pair in pairs:
+                    runner = CrawlerRunner(self._market_news_settings(pair))
+                    deferreds.append(runner.crawl('market_news', pair=pair))
+                DeferredList(deferreds, consumeErrors=True).addBoth(
+                    lambda results: (outcome.update(results=results), done.set()))
+
+            reactor.callFromThread(_start)
+            if not done.wait(timeout):
+                logger.error(f"Market news refresh did not finish within {timeout}s")
+                return
+
+            for pair, (success, result) in zip(pairs, outcome['results']):
+                if success:
+                    logger.info(f"✓ Market news refresh for {pair} completed")
+                    self.last_updates[f'market_news_{pair}'] = datetime.now().isoformat()
+                else:
+                    logger.error(f"Market news refresh for {pair} failed: {result}")
+            self._save_update_log()
         except Exception as e:
-            logger.error(f"Error refreshing market news for {pair}: {e}")
+            logger.error(f"Error refreshing market news: {e}")
     
     def refresh_prices(self):
         """Refresh market price data."""
         try:
             logger.info("Starting price refresh...")
-            cmd = [self.python_path, 'run.py', '--pairs', 'EURUSD,GBPUSD,USDJPY,GOLDUSD']
-            result = subprocess.run(cmd, cwd=self.project_path, capture_output=True, text=True, timeout=60)
-            
-            if result.returncode == 0:
-                logger.info("✓ Price refresh completed")
-                self.last_updates['prices'] = datetime.now().isoformat()
-                self._save_update_log()
-            else:
-                logger.warning(f"Price refresh had issues: {result.stderr[:200]}")
+            import run
+            run.run_once(['EURUSD', 'GBPUSD', 'USDJPY', 'GOLDUSD'])
+            logger.info("✓ Price refresh completed")
+            self.last_updates['prices'] = datetime.now().isoformat()
+            self._save_update_log()
         except Exception as e:
             logger.error(f"Error refreshing prices: {e}")
     
     def _save_update_log(self):
-        """Save last update times to file."""
+        """Mark the update log dirty and schedule one debounced flush.
+
+        Several jobs can complete within the same burst; a single flush 2s
+        later replaces up to ~7 back-to-back rewrites of the same file.
+        """
+        self._log_dirty = True
+        if self._log_flush_pending:
+            return
+        if self.scheduler.running:
+            self._log_flush_pending = True
+            self.scheduler.add_job(
+                self._flush_update_log,
+                trigger='date',
+                run_date=datetime.now() + timedelta(seconds=2),
+                id='flush_update_log',
+                replace_existing=True)
+        else:
+            self._flush_update_log()
+
+    def _flush_update_log(self):
+        """Write last update times atomically (tmp file + rename)."""
+        self._log_flush_pending = False
+        if not self._log_dirty:
+            return
+        self._log_dirty = False
         log_file = self.project_path / 'data' / 'refresh_log.json'
         log_file.parent.mkdir(exist_ok=True)
         try:
-            with open(log_file, 'w') as f:
-                json.dump(self.last_updates, f, indent=2)
+            tmp_file = log_file.with_suffix('.json.tmp')
+            tmp_file.write_bytes(orjson.dumps(self.last_updates, option=orjson.OPT_INDENT_2))
+            os.replace(tmp_file, log_file)
         except Exception as e:
             logger.error(f"Error saving update log: {e}")
     
@@ -152,18 +244,16 @@ class ForexDataScheduler:
         )
         logger.info("✓ Scheduled: News refresh every 15 minutes")
         
-        # Schedule market-specific news refresh for multiple pairs
-        pairs_to_monitor = ['GOLDUSD', 'EURUSD', 'GBPUSD', 'USDJPY']
-        for pair in pairs_to_monitor:
-            self.scheduler.add_job(
-                self.refresh_market_news,
-                trigger=IntervalTrigger(minutes=10),
-                id=f'refresh_market_news_{pair}',
-                name=f'Refresh Market News - {pair}',
-                kwargs={'pair': pair},
-                replace_existing=True
-            )
-        logger.info(f"✓ Scheduled: Market news refresh every 10 minutes for {len(pairs_to_monitor)} pairs")
+        # One job covers every monitored pair; the crawls run concurrently
+        # inside the shared reactor
+        self.scheduler.add_job(
+            self.refresh_market_news,
+            trigger=IntervalTrigger(minutes=10),
+            id='refresh_market_news',
+            name='Refresh Market News - All Pairs',
+            replace_existing=True
+        )
+        logger.info(f"✓ Scheduled: Market news refresh every 10 minutes for {len(self.pairs_to_monitor)} pairs")
         
         self.scheduler.add_job(
             self.refresh_prices,
@@ -176,13 +266,18 @@ class ForexDataScheduler:
         
         # Start scheduler
         self.scheduler.start()
+        # Readiness sentinel for the supervisor: all jobs are armed
+        (Path('logs') / 'scheduler.ready').touch()
         logger.info("="*60)
         logger.info("Scheduler running in background")
         logger.info("="*60)
     
     def stop(self):
         """Stop the background scheduler."""
+        (Path('logs') / 'scheduler.ready').unlink(missing_ok=True)
         self.scheduler.shutdown()
+        # Don't lose updates whose debounced flush hadn't fired yet
+        self._flush_update_log()
         logger.info("Scheduler stopped")
     
     def get_status(self):
@@ -10,18 +10,33 @@ Usage:
 """
 
 import subprocess
+import selectors
+import threading
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 import logging
+from logging.handlers import QueueHandler, QueueListener
+import queue
+import urllib.error
+import urllib.request
 from pathlib import Path
 import signal
 import os
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+# Setup logging: producers only enqueue records; a background listener
+# does the formatting and stream I/O, so logging never blocks the
+# monitor loop on the stream lock
+_log_queue = queue.SimpleQueue()
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+_log_listener = QueueListener(_log_queue, _stream_handler, respect_handler_level=True)
+_log_listener.start()
+_queue_handler = QueueHandler(_log_queue)
+# prepare() bakes this formatter into the queued record; keep it a
+# pass-through so the listener-side handler does the real formatting
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
 # Ensure logs directory exists
@@ -30,130 +45,353 @@ Path('logs').mkdir(exist_ok=True)
 class ForexAppManager:
     """Manages both dashboard and scheduler processes."""
     
-    def __init__(self, python_path='C:/Python312/python.exe'):
+    def __init__(self, python_path=sys.executable):
         self.python_path = python_path
-        self.dashboard_process = None
-        self.scheduler_process = None
-    
+        self.dashboard_pid = None
+        self.scheduler_pid = None
+        # Popen handles for children launched through the fallback path,
+        # keyed by pid; posix_spawn children are managed by pid alone
+        self._procs = {}
+        # Pre-import the scheduler (and with it pandas, Scrapy,
+        # APScheduler) so fork()ed starts inherit the warm heap instead
+        # of re-bootstrapping a fresh interpreter on every restart
+        try:
+            import scheduler as scheduler_module
+            self._scheduler_module = scheduler_module
+        except Exception as e:
+            logger.warning("Could not pre-import scheduler, will exec it instead: %s", e)
+            self._scheduler_module = None
+
+    @staticmethod
+    def _child_log(name):
+        """Open an append-mode log file for a child's stdout/stderr.
+
+        Nothing ever read the old PIPEs, so a chatty child would fill the
+        64KB pipe buffer and block on every further write; appending to a
+        buffered file can't stall the child.
+        """
+        return open(f'logs/{name}.out', 'ab', buffering=65536)
+
+    def _spawn(self, argv, log_name):
+        """Launch a child with its output redirected and return its pid.
+
+        On POSIX this goes through os.posix_spawn, which takes glibc's
+        vfork-style fast path and skips Popen's fork of the whole
+        supervisor address space plus the blocking exec-status pipe read.
+        The log redirect happens in the child via dup2 file actions.
+        """
+        log = self._child_log(log_name)
+        try:
+            if hasattr(os, 'posix_spawn'):
+                # Neither child reads stdin; give them /dev/null instead
+                # of sharing the supervisor's TTY
+                devnull = os.open(os.devnull, os.O_RDONLY)
+                try:
+                    return os.posix_spawn(argv[0], argv, os.environ, file_actions=[
+                        (os.POSIX_SPAWN_DUP2, devnull, 0),
+                        (os.POSIX_SPAWN_DUP2, log.fileno(), 1),
+                        (os.POSIX_SPAWN_DUP2, log.fileno(), 2),
+                    ])
+                finally:
+                    os.close(devnull)
+            process = subprocess.Popen(argv, stdin=subprocess.DEVNULL,
+                                       stdout=log, stderr=subprocess.STDOUT)
+            self._procs[process.pid] = process
+            return process.pid
+        finally:
+            log.close()
+
+    def _fork_scheduler(self):
+        """Fork the pre-imported scheduler instead of exec'ing a fresh one.
+
+        The forked child shares the supervisor's already-imported modules
+        copy-on-write, so a crash restart skips interpreter bootstrap and
+        the heavyweight imports entirely. Forking a multi-threaded process
+        can leave locks held forever in the child, so this path only runs
+        from the main thread — i.e. monitor restarts — with the log
+        listener joined across the fork; the initial start (a worker
+        thread in start_all's pool), platforms without fork, and a failed
+        pre-import all exec scheduler.py through _spawn instead.
+        """
+        if (not hasattr(os, 'fork') or self._scheduler_module is None
+                or threading.current_thread() is not threading.main_thread()):
+            return self._spawn([self.python_path, 'scheduler.py'], 'scheduler')
+        # Stop the listener so its thread cannot hold a logging lock at
+        # fork time; records queued meanwhile are drained on restart
+        _log_listener.stop()
+        pid = os.fork()
+        if pid:
+            _log_listener.start()
+            return pid
+        # Child: undo inherited supervisor signal plumbing, redirect
+        # output like _spawn does, and never return into supervisor code
+        try:
+            signal.set_wakeup_fd(-1)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            devnull = os.open(os.devnull, os.O_RDONLY)
+            os.dup2(devnull, 0)
+            os.close(devnull)
+            with self._child_log('scheduler') as log:
+                os.dup2(log.fileno(), 1)
+                os.dup2(log.fileno(), 2)
+            # The queue listener thread does not survive fork; give the
+            # child the synchronous handlers scheduler.py would set up
+            root = logging.getLogger()
+            for handler in root.handlers[:]:
+                root.removeHandler(handler)
+            logging.basicConfig(
+                level=logging.INFO,
+                format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+                handlers=[
+                    logging.FileHandler('logs/scheduler.log'),
+                    logging.StreamHandler()
+                ]
+            )
+            self._scheduler_module.ForexDataScheduler().run_forever()
+        finally:
+            os._exit(0)
+
     def start_dashboard(self):
         """Start Streamlit dashboard."""
         logger.info("Starting Streamlit Dashboard...")
         try:
-            self.dashboard_process = subprocess.Popen(
+            self.dashboard_pid = self._spawn(
                 [self.python_path, '-m', 'streamlit', 'run', 'dashboard.py', '--logger.level=error'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+                'dashboard')
+            # Return as soon as Streamlit's health endpoint answers instead
+            # of guessing at a startup delay
+            for _ in range(150):
+                try:
+                    urllib.request.urlopen('http://localhost:8501/_stcore/health', timeout=0.2)
+                    break
+                except (urllib.error.URLError, OSError):
+                    time.sleep(0.1)
             logger.info("✓ Dashboard started on http://localhost:8501")
             return True
         except Exception as e:
-            logger.error(f"Failed to start dashboard: {e}")
+            logger.error("Failed to start dashboard: %s", e)
             return False
-    
+
     def start_scheduler(self):
         """Start background scheduler."""
         logger.info("Starting Background Scheduler...")
         try:
-            self.scheduler_process = subprocess.Popen(
-                [self.python_path, 'scheduler.py'],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            time.sleep(2)  # Give scheduler time to start
+            ready = Path('logs/scheduler.ready')
+            ready.unlink(missing_ok=True)
+            self.scheduler_pid = self._fork_scheduler()
+            # scheduler.py touches the sentinel once its jobs are armed;
+            # wait for that instead of a fixed delay
+            for _ in range(50):
+                if ready.exists():
+                    break
+                time.sleep(0.1)
             logger.info("✓ Scheduler started (calendar every 30min, news every 15min, prices every 5min)")
             return True
         except Exception as e:
-            logger.error(f"Failed to start scheduler: {e}")
+            logger.error("Failed to start scheduler: %s", e)
             return False
     
     def start_all(self):
         """Start both dashboard and scheduler."""
-        logger.info("="*70)
-        logger.info("FOREX TRADING DASHBOARD - Production Mode")
-        logger.info("="*70)
-        
-        success = True
-        success = self.start_scheduler() and success
-        time.sleep(3)
-        success = self.start_dashboard() and success
-        
-        if success:
-            logger.info("="*70)
-            logger.info("✓ All services started successfully!")
-            logger.info("="*70)
-            logger.info("")
-            logger.info("Dashboard:  http://localhost:8501")
-            logger.info("Logs:       logs/scheduler.log")
-            logger.info("")
-            logger.info("Background tasks:")
-            logger.info("  • Economic calendar refresh: every 30 minutes")
-            logger.info("  • News articles refresh:     every 15 minutes")
-            logger.info("  • Price data refresh:        every 5 minutes")
-            logger.info("")
-            logger.info("Press Ctrl+C to stop all services")
-            logger.info("="*70)
-        
-        return success
+        # One multi-line record per banner: a single lock/format/flush
+        # instead of one per line
+        logger.info("\n".join([
+            "="*70,
+            "FOREX TRADING DASHBOARD - Production Mode",
+            "="*70,
+        ]))
+
+        # Spawn both children at once; with the readiness probes inside
+        # each start_*, boot time is the slower child's readiness rather
+        # than the sum of both
+        with ThreadPoolExecutor(max_workers=2) as ex:
+            futures = [ex.submit(self.start_scheduler), ex.submit(self.start_dashboard)]
+            success = all(f.result() for f in futures)
+
+        if not success:
+            # Don't leave a half-started system running behind a failure
+            logger.error("Failed to start services, stopping whatever came up")
+            self.stop_all()
+            return False
+
+        logger.info("\n".join([
+            "="*70,
+            "✓ All services started successfully!",
+            "="*70,
+            "",
+            "Dashboard:  http://localhost:8501",
+            "Logs:       logs/scheduler.log",
+            "",
+            "Background tasks:",
+            "  • Economic calendar refresh: every 30 minutes",
+            "  • News articles refresh:     every 15 minutes",
+            "  • Price data refresh:        every 5 minutes",
+            "",
+            "Press Ctrl+C to stop all services",
+            "="*70,
+        ]))
+
+        return True
     
+    def _reap(self, pid, timeout=None):
+        """Wait for an exited (or exiting) child; raises TimeoutError."""
+        process = self._procs.pop(pid, None)
+        if process is not None:
+            process.wait(timeout=timeout)
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                wpid, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                return
+            if wpid == pid:
+                return
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"pid {pid} did not exit within {timeout}s")
+            time.sleep(0.1)
+
+    def _stop_child(self, pid, name):
+        """SIGTERM one child and reap it, escalating to SIGKILL after 5s."""
+        if pid is None:
+            return
+        try:
+            os.kill(pid, signal.SIGTERM)
+            self._reap(pid, timeout=5)
+            logger.info("✓ %s stopped", name)
+        except (TimeoutError, subprocess.TimeoutExpired):
+            os.kill(pid, signal.SIGKILL)
+            self._reap(pid)
+            logger.info("✓ %s killed", name)
+        except (ProcessLookupError, ChildProcessError):
+            logger.info("✓ %s stopped", name)
+
     def stop_all(self):
         """Stop both processes."""
         logger.info("Stopping all services...")
-        
-        if self.dashboard_process:
-            try:
-                self.dashboard_process.terminate()
-                self.dashboard_process.wait(timeout=5)
-                logger.info("✓ Dashboard stopped")
-            except:
-                self.dashboard_process.kill()
-                logger.info("✓ Dashboard killed")
-        
-        if self.scheduler_process:
-            try:
-                self.scheduler_process.terminate()
-                self.scheduler_process.wait(timeout=5)
-                logger.info("✓ Scheduler stopped")
-            except:
-                self.scheduler_process.kill()
-                logger.info("✓ Scheduler killed")
-        
+
+        self._stop_child(self.dashboard_pid, 'Dashboard')
+        self.dashboard_pid = None
+
+        self._stop_child(self.scheduler_pid, 'Scheduler')
+        self.scheduler_pid = None
+
         logger.info("All services stopped")
+        _log_listener.stop()
     
     def monitor(self):
-        """Monitor both processes."""
+        """Monitor both processes and restart any that die."""
         try:
-            while True:
-                # Check if processes are still running
-                if self.dashboard_process and self.dashboard_process.poll() is not None:
-                    logger.warning("Dashboard process died, restarting...")
-                    self.start_dashboard()
-                
-                if self.scheduler_process and self.scheduler_process.poll() is not None:
-                    logger.warning("Scheduler process died, restarting...")
-                    self.start_scheduler()
-                
-                time.sleep(10)
+            if hasattr(os, 'pidfd_open'):
+                self._monitor_pidfd()
+            else:
+                self._monitor_polling()
         except KeyboardInterrupt:
             logger.info("\nShutdown requested")
-            self.stop_all()
-            sys.exit(0)
+        self.stop_all()
+        sys.exit(0)
+
+    def _watch_child(self, sel, name, restart, attr):
+        """Register a pidfd for one child so its exit wakes the selector."""
+        pid = getattr(self, attr)
+        if pid is not None:
+            fd = os.pidfd_open(pid)
+            sel.register(fd, selectors.EVENT_READ, (name, restart, attr))
+
+    def _monitor_pidfd(self):
+        """Block on child pidfds; wake and restart only when one exits.
+
+        Unlike the poll loop this costs zero wakeups while both children
+        are healthy, and a crash is noticed immediately instead of up to
+        10 seconds later. SIGINT/SIGTERM are routed into the same
+        selector through signal.set_wakeup_fd, so shutdown runs in loop
+        context rather than inside a signal handler (stop_all's blocking
+        waits and logging are not async-signal-safe).
+        """
+        wake_r, wake_w = os.pipe()
+        os.set_blocking(wake_r, False)
+        os.set_blocking(wake_w, False)
+        signal.set_wakeup_fd(wake_w)
+        # a handler must be installed for the wakeup fd to fire; the
+        # handler itself does nothing — the loop below does the work
+        signal.signal(signal.SIGINT, lambda signum, frame: None)
+        signal.signal(signal.SIGTERM, lambda signum, frame: None)
+        try:
+            with selectors.DefaultSelector() as sel:
+                sel.register(wake_r, selectors.EVENT_READ, None)
+                self._watch_child(sel, 'Dashboard', self.start_dashboard, 'dashboard_pid')
+                self._watch_child(sel, 'Scheduler', self.start_scheduler, 'scheduler_pid')
+                while True:
+                    for key, _ in sel.select():
+                        if key.fileobj == wake_r:
+                            os.read(wake_r, 64)
+                            logger.info("Shutdown requested")
+                            return
+                        name, restart, attr = key.data
+                        sel.unregister(key.fileobj)
+                        os.close(key.fileobj)
+                        self._reap(getattr(self, attr))  # already exited; won't block
+                        logger.warning("%s process died, restarting...", name)
+                        if restart():
+                            self._watch_child(sel, name, restart, attr)
+        finally:
+            signal.set_wakeup_fd(-1)
+            os.close(wake_r)
+            os.close(wake_w)
+
+    def _child_alive(self, pid):
+        process = self._procs.get(pid)
+        if process is not None:
+            return process.poll() is None
+        try:
+            return os.waitpid(pid, os.WNOHANG)[0] == 0
+        except ChildProcessError:
+            return False
+
+    def _monitor_polling(self):
+        """Fallback poll loop for platforms without pidfd support."""
+        while True:
+            self._reap_and_restart()
+            time.sleep(10)
+
+    def _reap_and_restart(self):
+        """Notice dead children and restart them.
+
+        With os.waitid one P_ALL query covers every child per tick
+        (WNOWAIT leaves the status in place for _reap); platforms
+        without it pay one liveness check per child.
+        """
+        children = {
+            self.dashboard_pid: ('Dashboard', self.start_dashboard),
+            self.scheduler_pid: ('Scheduler', self.start_scheduler),
+        }
+        children.pop(None, None)
+        if not hasattr(os, 'waitid'):
+            for pid, (name, restart) in children.items():
+                if not self._child_alive(pid):
+                    logger.warning("%s process died, restarting...", name)
+                    restart()
+            return
+        while children:
+            try:
+                info = os.waitid(os.P_ALL, 0, os.WNOHANG | os.WEXITED | os.WNOWAIT)
+            except ChildProcessError:
+                return
+            if info is None or info.si_pid not in children:
+                return
+            name, restart = children.pop(info.si_pid)
+            self._reap(info.si_pid)
+            logger.warning("%s process died, restarting...", name)
+            restart()
 
 
 if __name__ == '__main__':
     manager = ForexAppManager()
-    
-    # Handle Ctrl+C gracefully
-    def signal_handler(sig, frame):
-        manager.stop_all()
-        sys.exit(0)
-    
-    signal.signal(signal.SIGINT, signal_handler)
-    
-    # Start everything
+
+    # Start everything; Ctrl+C is handled inside monitor() in loop
+    # context via the wakeup fd, not in a signal handler
     if manager.start_all():
         manager.monitor()
     else:
-        logger.error("Failed to start services")
         sys.exit(1)
@@ -1,23 +1,32 @@
 import pandas as pd
+import pytest
 from forex_scraper.analyzer import price_momentum, DecisionEngine
 
 
-def test_price_momentum_positive():
-    s = pd.Series([1.0, 1.01, 1.02, 1.03, 1.04], index=pd.date_range('2025-01-01', periods=5))
-    m = price_momentum(s, window=3)
+@pytest.fixture(scope="module")
+def up_trend_series():
+    # Built once per module; DatetimeIndex construction is the costly part
+    return pd.Series([1.0, 1.02, 1.03, 1.04, 1.05], index=pd.date_range('2025-01-01', periods=5))
+
+
+@pytest.fixture(scope="session")
+def empty_series():
+    return pd.Series([], dtype=float)
+
+
+def test_price_momentum_positive(up_trend_series):
+    m = price_momentum(up_trend_series, window=3)
     assert m > 0
 
 
-def test_price_momentum_empty():
-    s = pd.Series([], dtype=float)
-    m = price_momentum(s)
+def test_price_momentum_empty(empty_series):
+    m = price_momentum(empty_series)
     assert m == 0.0
 
 
-def test_decision_engine_buy():
+def test_decision_engine_buy(up_trend_series):
     # news strongly positive and momentum positive -> BUY
     engine = DecisionEngine(news_weight=0.7, momentum_weight=0.3)
     news = [{'text': 'Economy strong growth, positive data'}, {'text': 'Central bank hints at hawkish stance'}]
-    prices = pd.Series([1.0, 1.02, 1.03, 1.04, 1.05], index=pd.date_range('2025-01-01', periods=5))
-    res = engine.decide(news, prices)
+    res = engine.decide(news, up_trend_series)
     assert res['decision'] in ('BUY', 'HOLD')